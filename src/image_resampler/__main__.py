@@ -1,70 +1,106 @@
 import click
-import matplotlib.pyplot as plt
 
 from . import __version__
 from .io import load_image, save_image
-from .methods import (
-    bilinear_interpolation,
-    l2_optimal_interpolation,
-    nearest_neighbor,
-    piecewise_linear_interpolation,
-)
+from .methods import METHOD_LABELS, METHODS, convert_dtype
+from .parallel import upscale_parallel
+from .params import SCALE, SIZE, format_scale, scale_for_size
 
 
 @click.command()
 @click.version_option(version=__version__)
 @click.argument("file", type=click.File(mode="rb"))
-@click.option("-m", "--method", default="nn", help="Method to use for interpolation. [nn|bl|pw|l2]")
-@click.option("-s", "--scale", type=int, default=2, help="Scaling factor.")
+@click.option(
+    "-m",
+    "--method",
+    type=click.Choice(list(METHODS)),
+    default="nn",
+    help="Method to use for interpolation.",
+)
+@click.option(
+    "-s", "--scale", type=SCALE, default="2", help="Scaling factor, e.g. 2, 1.5 or 2x3 (WxH)."
+)
+@click.option("--size", type=SIZE, help="Target size WxH, e.g. 1920x1080. Overrides --scale.")
 @click.option(
     "-v", "--verbose", is_flag=True, default=False, help="Print interpolation parameters."
 )
 @click.option(
     "--save", is_flag=True, default=False, help="Save interpolated image to examples/output/."
 )
-def main(
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of parallel workers (0 uses every CPU).",
+)
+@click.option(
+    "--show/--no-show",
+    default=True,
+    help="Display the result. --no-show runs headless and never imports matplotlib.",
+)
+def main(  # noqa: PLR0913
     file: click.File,
     method: str,
-    scale: int,
+    scale: float | tuple[float, float],
+    *,
     save: bool,
     verbose: bool,
+    jobs: int = 1,
+    show: bool = True,
+    size: tuple[int, int] | None = None,
 ) -> int | None:
     """Upscales an input image using the selected method.
 
-    After that displays the result.
+    After that displays the result, unless --no-show is given.
     Optionally saves the upscaled image to examples/output/ as <filename>_interp.png.
     """
     if verbose:
         click.secho(f"Interpolation method: {method}")
         click.secho(f"Filename: {file.name}")
-        click.secho(f"Scaling factor {scale}")
+        click.secho(
+            f"Scaling factor {format_scale(scale)}"
+            if size is None
+            else f"Target size {size[0]}x{size[1]}"
+        )
         click.secho(f"Save image? {'yes' if save else 'no'}")
+        click.secho(f"Workers: {jobs or 'all CPUs'}")
 
     image = load_image(file)
-    grey_scale = image.ndim == 2
-
-    match method:
-        case "nn":
-            out_image = nearest_neighbor(image, scale)
-        case "bl":
-            out_image = bilinear_interpolation(image, scale)
-        case "pw":
-            out_image = piecewise_linear_interpolation(image, scale)
-        case "l2":
-            out_image = l2_optimal_interpolation(image, scale)
-        case _:
-            click.secho(f"Incorrect '{method}' method. List of valid methods:", fg="red")
-            list_methods()
-            return 1
+    if size is not None:
+        scale = scale_for_size(image.shape, size)
+
+    func = METHODS.get(method)
+    if func is None:
+        click.secho(f"Incorrect '{method}' method. List of valid methods:", fg="red")
+        list_methods()
+        return 1
+    if jobs == 1:
+        out_image = func(image, scale, output_dtype=image.dtype)
+    else:
+        out_image = convert_dtype(
+            upscale_parallel(image, method, scale, workers=jobs), image.dtype, overwrite=True
+        )
 
     if save:
         out_name = str(file.name).split("/")[-1].split(".")[0]
         save_image(out_image, f"examples/output/{out_name}_interp.png")
         click.secho(f"Image {out_name} has been saved to examples/output/", fg="green")
 
+    if show:
+        show_comparison(image, out_image)
+    return None
+
+
+def show_comparison(image, out_image) -> None:
+    """
+    Display the original and interpolated images side by side.
+    """
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(1, 2, figsize=(16, 8))
 
-    if grey_scale:
+    if image.ndim == 2:
         axes[0].imshow(image, cmap="gray")
         axes[1].imshow(out_image, cmap="gray")
     else:
@@ -78,18 +114,10 @@ def main(
 
     plt.tight_layout()
     plt.show()
-    return None
 
 
 def list_methods() -> None:
-    click.echo(
-        """
-    nn - nearest neighbor
-    bl - bilinear
-    pw - piecewise linear
-    l2 - l2 optimal
-"""
-    )
+    click.echo("\n".join(f"    {key} - {label.lower()}" for label, key in METHOD_LABELS.items()))
 
 
 if __name__ == "__main__":
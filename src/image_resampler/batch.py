@@ -0,0 +1,202 @@
+import contextlib
+import queue
+import threading
+import time
+from pathlib import Path
+
+import click
+from PIL import Image
+
+from .io import load_image, save_image
+from .methods import METHODS, convert_dtype
+from .parallel import upscale_parallel
+from .params import SCALE, SIZE, scale_for_size
+
+# Marks the end of a stream in the pipeline queues.
+_DONE = None
+
+
+def _image_files(input_dir: Path) -> list[Path]:
+    """
+    Return the files in ``input_dir`` that Pillow (or NumPy, for ``.npy``) can open, sorted
+    by name.
+    """
+    extensions = {*Image.registered_extensions(), ".npy"}
+    return sorted(p for p in input_dir.iterdir() if p.is_file() and p.suffix.lower() in extensions)
+
+
+def _decode_worker(
+    todo: queue.Queue, decoded: queue.Queue, failures: list, stop: threading.Event
+) -> None:
+    while not stop.is_set() and (path := todo.get()) is not _DONE:
+        try:
+            decoded.put((path, load_image(path, mmap=True)))
+        except Exception as exc:  # noqa: BLE001
+            failures.append((path, exc))
+    decoded.put(_DONE)
+
+
+def _encode_worker(encoded: queue.Queue, output_dir: Path, saved: list, failures: list) -> None:
+    while (item := encoded.get()) is not _DONE:
+        path, out = item
+        try:
+            save_image(out, str(output_dir / path.name))
+            saved.append(path)
+        except Exception as exc:  # noqa: BLE001
+            failures.append((path, exc))
+
+
+def _drain(decoded: queue.Queue, decoders: list[threading.Thread]) -> None:
+    """
+    Discard decoded images until every decode worker has exited, so none stays blocked on
+    a full queue.
+    """
+    while any(thread.is_alive() for thread in decoders):
+        with contextlib.suppress(queue.Empty):
+            decoded.get(timeout=0.01)
+
+
+def run_batch(  # noqa: PLR0913
+    paths: list[Path],
+    output_dir: Path,
+    method: str,
+    scale,
+    *,
+    size: tuple[int, int] | None = None,
+    jobs: int = 1,
+    io_workers: int = 2,
+    queue_size: int = 8,
+) -> dict:
+    """
+    Upscale ``paths`` into ``output_dir`` through a bounded decode/compute/encode pipeline.
+
+    ``io_workers`` threads decode (or memory-map, for uncompressed files) and as many
+    encode, overlapping with the resampling in the calling thread. The queues between
+    stages hold at most ``queue_size`` images, which bounds memory regardless of the number
+    of files. If ``size`` (width, height) is given, each image is resampled to it instead
+    of by ``scale``. If the resampling loop is interrupted (e.g. by Ctrl-C), decoding
+    stops, the images already queued are encoded and all threads are joined before the
+    exception propagates.
+
+    Returns a summary with the processed count, failures, decoded megabytes and seconds.
+    """
+    todo: queue.Queue = queue.Queue()
+    for path in [*paths, *[_DONE] * io_workers]:
+        todo.put(path)
+    decoded: queue.Queue = queue.Queue(maxsize=queue_size)
+    encoded: queue.Queue = queue.Queue(maxsize=queue_size)
+    failures: list[tuple[Path, Exception]] = []
+    saved: list[Path] = []
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stop = threading.Event()
+    decoders = [
+        threading.Thread(target=_decode_worker, args=(todo, decoded, failures, stop))
+        for _ in range(io_workers)
+    ]
+    encoders = [
+        threading.Thread(target=_encode_worker, args=(encoded, output_dir, saved, failures))
+        for _ in range(io_workers)
+    ]
+    start = time.perf_counter()
+    for thread in [*decoders, *encoders]:
+        thread.start()
+    nbytes, finished = 0, 0
+    try:
+        while finished < io_workers:
+            item = decoded.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            path, image = item
+            # Memory-mapped files may be big-endian (16-bit PGM), which Pillow cannot encode.
+            dtype = image.dtype.newbyteorder("=")
+            factor = scale if size is None else scale_for_size(image.shape, size)
+            try:
+                if jobs == 1:
+                    out = METHODS[method](image, factor, output_dtype=dtype)
+                else:
+                    out = upscale_parallel(image, method, factor, workers=jobs)
+            except Exception as exc:  # noqa: BLE001
+                failures.append((path, exc))
+                continue
+            encoded.put((path, convert_dtype(out, dtype, overwrite=True)))
+            nbytes += image.nbytes
+    finally:
+        stop.set()
+        _drain(decoded, decoders)
+        for _ in range(io_workers):
+            encoded.put(_DONE)
+        for thread in [*decoders, *encoders]:
+            thread.join()
+    return {
+        "processed": len(saved),
+        "failures": failures,
+        "megabytes": nbytes / 1e6,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+@click.command()
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument("output_dir", type=click.Path(file_okay=False, path_type=Path))
+@click.option(
+    "-m", "--method", type=click.Choice(list(METHODS)), default="bl", help="Interpolation method."
+)
+@click.option(
+    "-s", "--scale", type=SCALE, default="2", help="Scaling factor, e.g. 2, 1.5 or 2x3 (WxH)."
+)
+@click.option("--size", type=SIZE, help="Target size WxH, e.g. 1920x1080. Overrides --scale.")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of parallel workers (0 uses every CPU).",
+)
+@click.option(
+    "--io-workers", type=click.IntRange(min=1), default=2, help="Decode and encode threads."
+)
+@click.option(
+    "--queue-size",
+    type=click.IntRange(min=1),
+    default=8,
+    help="Maximum number of images buffered between pipeline stages.",
+)
+def batch(  # noqa: PLR0913
+    input_dir: Path,
+    output_dir: Path,
+    *,
+    method: str,
+    scale: float | tuple[float, float],
+    size: tuple[int, int] | None,
+    jobs: int,
+    io_workers: int,
+    queue_size: int,
+) -> None:
+    """Upscale every image in INPUT_DIR into OUTPUT_DIR without opening any window.
+
+    Decoding, resampling and encoding run as an overlapping pipeline. Output files keep
+    their input names. Throughput is reported at the end.
+    """
+    paths = _image_files(input_dir)
+    stats = run_batch(
+        paths,
+        output_dir,
+        method,
+        scale,
+        size=size,
+        jobs=jobs,
+        io_workers=io_workers,
+        queue_size=queue_size,
+    )
+    for path, exc in stats["failures"]:
+        click.secho(f"Failed: {path.name}: {exc}", fg="red")
+    seconds = max(stats["seconds"], 1e-9)
+    click.secho(
+        f"Upscaled {stats['processed']}/{len(paths)} images in {seconds:.2f}s: "
+        f"{stats['processed'] / seconds:.2f} images/s, "
+        f"{stats['megabytes'] / seconds:.2f} MB/s (decoded input)",
+        fg="green" if not stats["failures"] else "yellow",
+    )
+    if stats["failures"]:
+        raise SystemExit(1)
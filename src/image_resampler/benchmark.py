@@ -1,54 +1,433 @@
+import csv
+import io
+import json
+import math
 import time
+import tracemalloc
+from collections.abc import Callable
 
 import click
-from skimage.transform import resize
+import numpy as np
 
 from .io import load_image
-from .methods import (
-    bilinear_interpolation,
-    l2_optimal_interpolation,
-    nearest_neighbor,
-    piecewise_linear_interpolation,
+from .methods import METHOD_LABELS, METHODS, _scale_pair, resize
+from .metrics import compute_metrics, compute_ssim
+from .parallel import upscale_parallel
+from .params import SCALE, SIZE, format_scale, scale_for_size
+
+# Columns of the JSON/CSV report, in order.
+FIELDS = (
+    "method",
+    "key",
+    "scale",
+    "warmup",
+    "repeat",
+    "time_min_s",
+    "time_median_s",
+    "time_p95_s",
+    "peak_memory_bytes",
+    "psnr",
+    "ssim",
+    "mse",
 )
-from .metrics import compute_mse, compute_psnr, compute_ssim
+
+
+# Columns of the benchmark-suite report, in order.
+SUITE_FIELDS = (
+    "method",
+    "size",
+    "channels",
+    "dtype",
+    "scale",
+    "input_megapixels",
+    "output_megapixels",
+    "time_min_s",
+    "time_median_s",
+    "time_p95_s",
+    "peak_memory_bytes",
+    "megapixels_per_s",
+    "status",
+)
+
+
+def timing_stats(samples_ns: list[int]) -> dict:
+    """
+    Summarize ``perf_counter_ns`` samples as min, median and 95th percentile in seconds.
+    """
+    samples = np.asarray(samples_ns, dtype=np.float64) / 1e9
+    return {
+        "time_min_s": float(samples.min()),
+        "time_median_s": float(np.median(samples)),
+        "time_p95_s": float(np.percentile(samples, 95)),
+    }
+
+
+def measure(func: Callable[[], np.ndarray], warmup: int = 1, repeat: int = 5) -> tuple:
+    """
+    Time ``func`` after ``warmup`` untimed calls, then run it once more to trace memory.
+
+    Returns the timing statistics of ``repeat`` timed calls, the peak traced allocation of
+    the traced call in bytes, and that call's result.
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func()
+        samples.append(time.perf_counter_ns() - start)
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return timing_stats(samples), peak, result
+
+
+def run_benchmark(
+    original: np.ndarray, scale, *, warmup: int = 1, repeat: int = 5, jobs: int = 1
+) -> list[dict]:
+    """
+    Benchmark every method on ``original`` and return one result record per method.
+
+    ``scale`` may be fractional or an ``(h_scale, w_scale)`` pair.
+    """
+    # Downscale the image, antialiased
+    h_scale, w_scale = _scale_pair(scale)
+    down_shape = (
+        max(1, round(original.shape[0] / h_scale)),
+        max(1, round(original.shape[1] / w_scale)),
+        *original.shape[2:],
+    )
+    low_res = resize(original, down_shape)
+
+    records = []
+    for name, key in METHOD_LABELS.items():
+        func = METHODS[key]
+        if jobs == 1:
+            call = lambda func=func: func(low_res, scale)  # noqa: E731
+        else:
+            call = lambda key=key: upscale_parallel(low_res, key, scale, workers=jobs)  # noqa: E731
+        stats, peak, upscaled = measure(call, warmup=warmup, repeat=repeat)
+        # Check shape
+        if upscaled.shape != original.shape:
+            upscaled = resize(upscaled, original.shape, output_dtype=original.dtype)
+        scores = compute_metrics(original, upscaled)
+        records.append(
+            {
+                "method": name,
+                "key": key,
+                "scale": scale if isinstance(scale, (int, float)) else format_scale(scale),
+                "warmup": warmup,
+                "repeat": repeat,
+                **stats,
+                "peak_memory_bytes": peak,
+                "psnr": scores["psnr"],
+                "ssim": float(compute_ssim(original, upscaled)),
+                "mse": scores["mse"],
+            }
+        )
+    return records
+
+
+def _text_line(record: dict) -> str:
+    return (
+        f"{record['method']}: time={record['time_median_s']:.3f}s "
+        f"(min={record['time_min_s']:.3f}s, p95={record['time_p95_s']:.3f}s), "
+        f"peak_mem={record['peak_memory_bytes'] / 1e6:.1f}MB, "
+        f"PSNR={record['psnr']:.2f}, SSIM={record['ssim']:.3f}, MSE={record['mse']:.2f}"
+    )
+
+
+def format_results(
+    records: list[dict],
+    fmt: str,
+    fields: tuple[str, ...] = FIELDS,
+    text_line: Callable[[dict], str] = _text_line,
+) -> str:
+    """
+    Render benchmark records as ``text``, ``json`` or ``csv``.
+
+    ``fields`` selects the CSV columns and ``text_line`` renders one record as text.
+    Non-finite metrics (e.g. an infinite PSNR) are written as ``null`` in JSON.
+    """
+    if fmt == "json":
+        rows = [
+            {k: None if isinstance(v, float) and not math.isfinite(v) else v for k, v in r.items()}
+            for r in records
+        ]
+        return json.dumps(rows, indent=2)
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+        return buffer.getvalue().rstrip("\n")
+    return "\n".join(text_line(r) for r in records)
+
+
+def _write_report(report: str, output: str | None) -> None:
+    if output:
+        with click.open_file(output, "w") as f:
+            f.write(report + "\n")
+        click.secho(f"Results written to {output}", fg="green")
+    else:
+        click.echo(report)
 
 
 @click.command()
 @click.argument("input", type=click.Path(exists=True))
-@click.option("-s", "--scale", type=int, default=2, help="Scaling factor.")
-def benchmark(input, scale) -> None:  # noqa: A002
+@click.option(
+    "-s", "--scale", type=SCALE, default="2", help="Scaling factor, e.g. 2, 1.5 or 2x3 (WxH)."
+)
+@click.option(
+    "--size",
+    type=SIZE,
+    help="Size WxH of the downscaled input to upscale back from. Overrides --scale.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of parallel workers (0 uses every CPU).",
+)
+@click.option("--warmup", type=click.IntRange(min=0), default=1, help="Untimed runs before timing.")
+@click.option("--repeat", type=click.IntRange(min=1), default=5, help="Timed runs per method.")
+@click.option(
+    "-f",
+    "--format",
+    "fmt",
+    type=click.Choice(["text", "json", "csv"]),
+    default="text",
+    help="Output format.",
+)
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write results to this file.")
+def benchmark(  # noqa: PLR0913
+    input,  # noqa: A002
+    scale,
+    *,
+    jobs=1,
+    warmup=1,
+    repeat=5,
+    fmt="text",
+    output=None,
+    size=None,
+) -> None:
     """Benchmark all interpolation methods on a single image.
 
     Downscales the image, then upscales it back and compares to the original.
+    Each method is timed over --repeat runs after --warmup runs and reported with its
+    median, min and 95th percentile time, peak traced memory, PSNR, SSIM and MSE.
     """
     original = load_image(input)
-    # Downscale the image
-    down_shape = (original.shape[0] // scale, original.shape[1] // scale)
-    if original.ndim == 3:
-        down_shape = (down_shape[0], down_shape[1], original.shape[2])
-    low_res = resize(original, down_shape, anti_aliasing=True, preserve_range=True).astype(
-        original.dtype
+    if size is not None:
+        width, height = size
+        scale = scale_for_size((height, width), (original.shape[1], original.shape[0]))
+    records = run_benchmark(original, scale, warmup=warmup, repeat=repeat, jobs=jobs)
+    _write_report(format_results(records, fmt), output)
+
+
+def synthetic_image(size: int, channels: int, dtype: np.dtype, seed: int = 0) -> np.ndarray:
+    """
+    Generate a ``size x size`` test image: smooth gradients plus noise, spanning the range
+    of ``dtype`` (``[0, 1]`` for floats). ``channels == 1`` gives a 2-D grayscale image.
+    """
+    rng = np.random.default_rng(seed)
+    ramp = np.linspace(0.0, 1.0, size, dtype=np.float32)
+    base = 0.5 + 0.25 * np.sin(6 * ramp[:, None]) * np.cos(4 * ramp[None, :])
+    shape = (size, size) if channels == 1 else (size, size, channels)
+    noisy = base.reshape(size, size, *[1] * (len(shape) - 2))
+    noisy = np.clip(noisy + 0.2 * rng.random(shape, dtype=np.float32), 0.0, 1.0)
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        return np.rint(noisy * np.iinfo(dtype).max).astype(dtype)
+    return noisy.astype(dtype)
+
+
+def run_suite(  # noqa: PLR0913
+    sizes: list[int],
+    channels: list[int],
+    dtypes: list[str],
+    scales: list[float],
+    methods: list[str],
+    *,
+    warmup: int = 1,
+    repeat: int = 3,
+    max_output_megapixels: float = 64.0,
+) -> list[dict]:
+    """
+    Run every method over the size x channels x dtype x scale matrix of synthetic inputs.
+
+    Throughput is output megapixels per second at the median time. Cells whose output
+    would exceed ``max_output_megapixels`` are marked ``skipped`` (an input is only
+    synthesized if at least one of its cells runs), and cells a method rejects with a
+    ``ValueError`` are marked ``unsupported``.
+    """
+    records = []
+    for size in sizes:
+        for n_channels in channels:
+            for dtype in dtypes:
+                # Synthesized on first use, so inputs whose every cell is skipped cost nothing.
+                image = None
+                for scale in scales:
+                    out_side = round(size * scale)
+                    cell = {
+                        "size": size,
+                        "channels": n_channels,
+                        "dtype": dtype,
+                        "scale": scale,
+                        "input_megapixels": size * size / 1e6,
+                        "output_megapixels": out_side * out_side / 1e6,
+                    }
+                    for method in methods:
+                        record = {"method": method, **cell}
+                        records.append(record)
+                        if cell["output_megapixels"] > max_output_megapixels:
+                            record["status"] = "skipped"
+                            continue
+                        if image is None:
+                            image = synthetic_image(size, n_channels, dtype)
+                        func = METHODS[method]
+                        try:
+                            stats, peak, _ = measure(
+                                lambda f=func, a=image, s=scale: f(a, s),
+                                warmup=warmup,
+                                repeat=repeat,
+                            )
+                        except ValueError:
+                            record["status"] = "unsupported"
+                            continue
+                        record.update(stats, peak_memory_bytes=peak, status="ok")
+                        record["megapixels_per_s"] = cell["output_megapixels"] / max(
+                            stats["time_median_s"], 1e-12
+                        )
+    return records
+
+
+def _suite_line(record: dict) -> str:
+    cell = (
+        f"{record['method']:>3} {record['size']:>5}x{record['size']:<5} "
+        f"c={record['channels']} {record['dtype']:>7} x{record['scale']:g}"
+    )
+    if record["status"] != "ok":
+        return f"{cell}: {record['status']}"
+    return (
+        f"{cell}: {record['megapixels_per_s']:10.2f} MP/s "
+        f"(median={record['time_median_s']:.4f}s, "
+        f"peak_mem={record['peak_memory_bytes'] / 1e6:.1f}MB)"
     )
 
-    methods = {
-        "Nearest Neighbor": nearest_neighbor,
-        "Bilinear": bilinear_interpolation,
-        "Piecewise Linear": piecewise_linear_interpolation,
-        "L2 Optimal": l2_optimal_interpolation,
-    }
-    for name, func in methods.items():
-        start = time.time()
-        upscaled = func(low_res, scale)
-        elapsed = time.time() - start
-        # Check shape
-        if upscaled.shape != original.shape:
-            upscaled = resize(
-                upscaled, original.shape, anti_aliasing=True, preserve_range=True
-            ).astype(original.dtype)
-        psnr = compute_psnr(original, upscaled)
-        ssim = compute_ssim(original, upscaled)
-        mse = compute_mse(original, upscaled)
-        click.echo(f"{name}: time={elapsed:.3f}s, PSNR={psnr:.2f}, SSIM={ssim:.3f}, MSE={mse:.2f}")
+
+def _comma_list(cast: Callable) -> Callable:
+    """
+    Build a click callback that parses a comma-separated option into a list of ``cast``.
+    """
+
+    def parse(_ctx: click.Context, param: click.Parameter, value: str) -> list:
+        try:
+            return [cast(item) for item in value.split(",") if item.strip()]
+        except (TypeError, ValueError) as exc:
+            msg = f"Invalid list {value!r}: {exc}"
+            raise click.BadParameter(msg, param=param) from exc
+
+    return parse
+
+
+def _dtype_name(name: str) -> str:
+    return np.dtype(name.strip()).name
+
+
+def _method_name(name: str) -> str:
+    name = name.strip()
+    if name not in METHODS:
+        msg = f"unknown method {name!r}, expected one of {', '.join(METHODS)}"
+        raise ValueError(msg)
+    return name
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default="64,256,1024",
+    callback=_comma_list(int),
+    help="Comma-separated square input sizes, e.g. 64,256,1024,4096,8192.",
+)
+@click.option(
+    "--channels",
+    default="1,3,4",
+    callback=_comma_list(int),
+    help="Comma-separated channel counts (1 = grayscale, 3 = RGB, 4 = RGBA).",
+)
+@click.option(
+    "--dtypes",
+    default="uint8,uint16,float32",
+    callback=_comma_list(_dtype_name),
+    help="Comma-separated input dtypes.",
+)
+@click.option(
+    "--scales",
+    default="1.5,2,4,8",
+    callback=_comma_list(float),
+    help="Comma-separated scaling factors.",
+)
+@click.option(
+    "--methods",
+    default=",".join(METHODS),
+    callback=_comma_list(_method_name),
+    help="Comma-separated methods to run.",
+)
+@click.option("--warmup", type=click.IntRange(min=0), default=1, help="Untimed runs before timing.")
+@click.option("--repeat", type=click.IntRange(min=1), default=3, help="Timed runs per cell.")
+@click.option(
+    "--max-output-megapixels",
+    type=float,
+    default=64.0,
+    help=(
+        "Skip cells whose output is larger than this. The default of 64 skips 8192x8192 "
+        "inputs at every scale from x1 and 4096x4096 inputs from x2; raise it to "
+        "time those."
+    ),
+)
+@click.option(
+    "-f",
+    "--format",
+    "fmt",
+    type=click.Choice(["text", "json", "csv"]),
+    default="text",
+    help="Output format.",
+)
+@click.option("-o", "--output", type=click.Path(dir_okay=False), help="Write results to this file.")
+def benchmark_suite(  # noqa: PLR0913
+    *,
+    sizes: list[int],
+    channels: list[int],
+    dtypes: list[str],
+    scales: list[float],
+    methods: list[str],
+    warmup: int,
+    repeat: int,
+    max_output_megapixels: float,
+    fmt: str,
+    output: str | None,
+) -> None:
+    """Benchmark every method over a matrix of synthetic inputs.
+
+    Sweeps input sizes, channel layouts, dtypes and scales, and reports each method's
+    throughput in output megapixels per second so complexity cliffs stand out.
+    """
+    records = run_suite(
+        sizes,
+        channels,
+        dtypes,
+        scales,
+        methods,
+        warmup=warmup,
+        repeat=repeat,
+        max_output_megapixels=max_output_megapixels,
+    )
+    _write_report(format_results(records, fmt, SUITE_FIELDS, _suite_line), output)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,53 @@
-import click
+import importlib
 
-from .__main__ import main as upscale
-from .benchmark import benchmark
-from .gui import rungui
-from .visualize import example
+import click
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group that imports a subcommand's module only when that subcommand is used.
+
+    Keeps ``image-resampler upscale`` from importing matplotlib, tkinter or scikit-image.
+    """
+
+    def __init__(
+        self, *args: object, lazy_subcommands: dict[str, str] | None = None, **kwargs: object
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # Maps command name to "module:attribute", relative to this package.
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            module = importlib.import_module(module_name, __package__)
+            return getattr(module, attribute)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "example": ".visualize:example",
+        "benchmark": ".benchmark:benchmark",
+        "benchmark-suite": ".benchmark:benchmark_suite",
+        "upscale": ".__main__:main",
+        "batch": ".batch:batch",
+        "stream": ".stream:stream",
+    },
+)
 def cli() -> None:
     """image-resampler: Image Upscaling Toolkit CLI."""
 
 
-cli.add_command(example, name="example")
-cli.add_command(benchmark, name="benchmark")
-cli.add_command(upscale, name="upscale")
-
-
 @click.command()
 def gui() -> None:
     """Launch the graphical user interface."""
+    from .gui import rungui
+
     rungui()
 
 
@@ -1,16 +1,201 @@
+import sys
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from collections import OrderedDict
+from collections.abc import Callable
+from tkinter import filedialog, messagebox, ttk
 
 import numpy as np
 from PIL import Image, ImageTk
 
 from .io import load_image, save_image
-from .methods import (
-    bilinear_interpolation,
-    l2_optimal_interpolation,
-    nearest_neighbor,
-    piecewise_linear_interpolation,
-)
+from .methods import _SEPARABLE_METHODS, METHOD_LABELS, METHODS
+from .params import format_scale, parse_scale, parse_size, scale_for_size
+from .tiling import upscale_tiled
+
+# Output rows per progress step of a background upscale.
+_BAND_ROWS = 64
+
+# How often the main loop checks on a background upscale, in milliseconds.
+_POLL_MS = 50
+
+# Size of the image views, in pixels.
+_DISPLAY_W, _DISPLAY_H = 400, 400
+
+# Rendered views kept per zoom level, and the shortest interval between zoom re-renders.
+_ZOOM_CACHE_SIZE = 16
+_ZOOM_THROTTLE_MS = 30
+
+
+# Default memory budget of the upscale result cache, in bytes.
+_RESULT_CACHE_BYTES = 512 << 20
+
+
+class ResultCache:
+    """
+    LRU cache of upscale results, bounded by their total size in bytes.
+
+    Results larger than the whole budget are not cached. Used from the Tk main loop only.
+
+    Args:
+        budget_bytes: Memory budget. ``0`` disables caching.
+    """
+
+    def __init__(self, budget_bytes: int = _RESULT_CACHE_BYTES) -> None:
+        self.budget_bytes = budget_bytes
+        self.nbytes = 0
+        self._results: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: tuple) -> np.ndarray | None:
+        """
+        Return the result stored under ``key``, marking it recently used, or ``None``.
+        """
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+        return result
+
+    def put(self, key: tuple, result: np.ndarray) -> None:
+        """
+        Store ``result`` under ``key``, evicting least recently used results over budget.
+        """
+        if key in self._results:
+            self.nbytes -= self._results.pop(key).nbytes
+        if result.nbytes > self.budget_bytes:
+            return
+        self._results[key] = result
+        self.nbytes += result.nbytes
+        while self.nbytes > self.budget_bytes:
+            self.nbytes -= self._results.popitem(last=False)[1].nbytes
+
+    def clear(self) -> None:
+        self._results.clear()
+        self.nbytes = 0
+
+
+class ViewCache:
+    """
+    LRU cache of rendered views, bounded by their count.
+
+    Used from the Tk main loop only.
+
+    Args:
+        maxsize: Number of views kept.
+    """
+
+    def __init__(self, maxsize: int = _ZOOM_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._views: OrderedDict[tuple, ImageTk.PhotoImage] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def get(self, key: tuple, render: Callable[[], ImageTk.PhotoImage]) -> ImageTk.PhotoImage:
+        """
+        Return the view stored under ``key``, rendering and storing it on a miss.
+        """
+        if key in self._views:
+            self._views.move_to_end(key)
+            return self._views[key]
+        view = render()
+        self._views[key] = view
+        if len(self._views) > self.maxsize:
+            self._views.popitem(last=False)
+        return view
+
+    def clear(self) -> None:
+        self._views.clear()
+
+
+def zoom_viewport(
+    image: np.ndarray, zoom: float, size: tuple[int, int] = (_DISPLAY_W, _DISPLAY_H)
+) -> np.ndarray:
+    """
+    Return the centered ``size`` (width, height) window of ``image`` zoomed by ``zoom``.
+
+    Matches resizing the whole image to ``int(w * zoom) x int(h * zoom)`` with
+    ``Image.NEAREST`` and center-cropping, but only the visible pixels are gathered from
+    ``image``, so the cost depends on the window size, not the image size or zoom.
+    """
+    idx = []
+    for length, view in ((image.shape[0], size[1]), (image.shape[1], size[0])):
+        zoomed = max(1, int(length * zoom))
+        start = max(0, (zoomed - view) // 2)
+        pos = np.arange(start, min(start + view, zoomed))
+        idx.append(np.minimum(((pos + 0.5) * (length / zoomed)).astype(np.intp), length - 1))
+    return image[idx[0][:, None], idx[1]]
+
+
+class UpscaleCancelledError(Exception):
+    """
+    Raised in a worker thread to abandon a cancelled upscale.
+    """
+
+
+class UpscaleJob:
+    """
+    An upscale running on a daemon worker thread.
+
+    Separable methods run as full-width bands of output rows (see
+    :func:`~image_resampler.tiling.upscale_tiled`), updating :attr:`progress` (0 to 1)
+    after each band and stopping at the next band once :meth:`cancel` is called. ``l2``
+    transforms the whole image at once, so it reports no progress until it is done. The
+    worker only writes :attr:`progress`, :attr:`result` and :attr:`error`; the GUI reads
+    them from the Tk main loop.
+    """
+
+    def __init__(self, image: np.ndarray, method: str, scale) -> None:
+        self.method = method
+        self.scale = scale
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(image,), daemon=True)
+
+    def start(self) -> "UpscaleJob":
+        self._thread.start()
+        return self
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def wait(self, timeout: float | None = None) -> None:
+        self._thread.join(timeout)
+
+    def _step(self, done: int, total: int) -> None:
+        self.progress = done / total
+        if self._cancelled.is_set():
+            raise UpscaleCancelledError
+
+    def _run(self, image: np.ndarray) -> None:
+        try:
+            if self.method in _SEPARABLE_METHODS:
+                self.result = upscale_tiled(
+                    image,
+                    self.method,
+                    self.scale,
+                    tile_size=(_BAND_ROWS, sys.maxsize),
+                    progress=self._step,
+                )
+            else:
+                self.result = METHODS[self.method](image, self.scale, output_dtype=image.dtype)
+            self.progress = 1.0
+        except UpscaleCancelledError:
+            pass
+        except Exception as exc:  # noqa: BLE001 - reported to the user by the GUI
+            self.error = exc
 
 
 class UpscaleApp(tk.Tk):
@@ -25,12 +210,17 @@ class UpscaleApp(tk.Tk):
         - Modern, user-friendly interface
     """
 
-    def __init__(self) -> None:
+    def __init__(self, cache_bytes: int = _RESULT_CACHE_BYTES) -> None:
         super().__init__()
         self.title("Image Upscaling App")
         self.geometry("800x600")
         self.image = None
         self.out_image = None
+        self._image_id = 0
+        self._results = ResultCache(cache_bytes)
+        self._job = None
+        self._views = ViewCache()
+        self._zoom_pending = None
         self.create_widgets()
 
     def create_widgets(self) -> None:  # noqa: PLR0915
@@ -74,21 +264,14 @@ class UpscaleApp(tk.Tk):
         method_frame.pack(side=tk.LEFT, padx=5)
         tk.Label(method_frame, text="Method:", font=font, bg=bg, fg=fg).pack(side=tk.LEFT)
         self.method_var = tk.StringVar(value="Bilinear")
-        method_menu = tk.OptionMenu(
-            method_frame,
-            self.method_var,
-            "Nearest Neighbor",
-            "Bilinear",
-            "Piecewise Linear",
-            "L2 Optimal",
-        )
+        method_menu = tk.OptionMenu(method_frame, self.method_var, *METHOD_LABELS)
         method_menu.config(font=font, bg=btn_bg, fg=btn_fg, highlightthickness=0)
         method_menu.pack(side=tk.LEFT, padx=5)
 
         scale_frame = tk.Frame(center_controls, bg=bg)
         scale_frame.pack(side=tk.LEFT, padx=5)
         tk.Label(scale_frame, text="Scale:", font=font, bg=bg, fg=fg).pack(side=tk.LEFT)
-        self.scale_var = tk.IntVar(value=2)
+        self.scale_var = tk.StringVar(value="2")
         scale_entry = tk.Entry(
             scale_frame,
             textvariable=self.scale_var,
@@ -98,6 +281,18 @@ class UpscaleApp(tk.Tk):
             fg=entry_fg,
         )
         scale_entry.pack(side=tk.LEFT, padx=5)
+        # Optional target size WxH; overrides the scale when set.
+        tk.Label(scale_frame, text="Size:", font=font, bg=bg, fg=fg).pack(side=tk.LEFT)
+        self.size_var = tk.StringVar(value="")
+        size_entry = tk.Entry(
+            scale_frame,
+            textvariable=self.size_var,
+            width=10,
+            font=font,
+            bg=entry_bg,
+            fg=entry_fg,
+        )
+        size_entry.pack(side=tk.LEFT, padx=5)
 
         # Right side controls
         right_controls = tk.Frame(control_frame, bg=bg)
@@ -114,6 +309,18 @@ class UpscaleApp(tk.Tk):
         )
         self.upscale_btn.pack(side=tk.LEFT, padx=5)
 
+        self.cancel_btn = tk.Button(
+            right_controls,
+            text="Cancel",
+            width=8,
+            font=font,
+            bg=btn_bg,
+            fg=btn_fg,
+            state=tk.DISABLED,
+            command=self.cancel_upscale,
+        )
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+
         self.save_btn = tk.Button(
             right_controls,
             text="Save Result",
@@ -153,7 +360,7 @@ class UpscaleApp(tk.Tk):
             fg=fg,
             troughcolor=btn_bg,
             highlightthickness=0,
-            command=lambda _: self.update_images_zoom(),
+            command=lambda _: self._schedule_zoom(),
         )
         zoom_slider.pack(side=tk.LEFT, padx=10)
 
@@ -185,47 +392,74 @@ class UpscaleApp(tk.Tk):
         )
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
+        # Progress of a background upscale, above the status bar
+        self.progress_var = tk.DoubleVar(value=0.0)
+        self.progress_bar = ttk.Progressbar(
+            self, variable=self.progress_var, maximum=100.0, mode="determinate"
+        )
+        self.progress_bar.pack(side=tk.BOTTOM, fill=tk.X)
+
     def open_image(self) -> None:
         path = filedialog.askopenfilename()
         if path:
             self.image = load_image(path)
+            # Results of the previous image can no longer be shown.
+            self.cancel_upscale()
+            self._image_id += 1
+            self._results.clear()
             self.display_original(self.image)
             self.status_var.set(f"Loaded: {path}")
 
     def _update_label_image(self, label, img_arr, zoom=1.0, scale_factor=1.0) -> None:
         if img_arr is None:
             return
-        # Fixed display area
-        display_w, display_h = 400, 400
-        img = Image.fromarray(img_arr)
-        w, h = img.size
         # Adjust zoom for upscaled image so it appears smaller by scale_factor initially
         effective_zoom = zoom / scale_factor if scale_factor != 1.0 else zoom
-        new_w, new_h = max(1, int(w * effective_zoom)), max(1, int(h * effective_zoom))
-        img = img.resize((new_w, new_h), Image.NEAREST)
-        # Center crop to display area
-        left = max(0, (new_w - display_w) // 2)
-        upper = max(0, (new_h - display_h) // 2)
-        right = left + display_w
-        lower = upper + display_h
-        img = img.crop((left, upper, right, lower))
-        imgtk = ImageTk.PhotoImage(img)
+        key = (str(label), round(effective_zoom, 6))
+
+        def render() -> ImageTk.PhotoImage:
+            return ImageTk.PhotoImage(Image.fromarray(zoom_viewport(img_arr, effective_zoom)))
+
+        imgtk = self._views.get(key, render)
         label.imgtk = imgtk
-        label.config(image=imgtk, width=display_w, height=display_h)
+        label.config(image=imgtk, width=_DISPLAY_W, height=_DISPLAY_H)
 
     def display_original(self, img_arr: np.ndarray) -> None:
-        self._original_img_arr = img_arr.copy() if img_arr is not None else None
+        self._original_img_arr = img_arr
+        self._views.clear()
         self._update_label_image(self.original_label, img_arr)
 
+    def _result_scale(self) -> float:
+        """
+        Width ratio of the result to the original, used to show both at the same size.
+        """
+        result = getattr(self, "_result_img_arr", None)
+        if self.image is None or result is None:
+            return 1.0
+        return result.shape[1] / self.image.shape[1]
+
     def display_result(self, img_arr: np.ndarray) -> None:
-        self._result_img_arr = img_arr.copy() if img_arr is not None else None
+        self._result_img_arr = img_arr
+        self._views.clear()
         # Use the current scale factor for initial display
-        scale = self.scale_var.get() if hasattr(self, "scale_var") else 1.0
-        self._update_label_image(self.result_label, img_arr, scale_factor=scale)
+        self._update_label_image(self.result_label, img_arr, scale_factor=self._result_scale())
+
+    def _schedule_zoom(self) -> None:
+        """
+        Re-render the views for the zoom slider at most once per ``_ZOOM_THROTTLE_MS``.
+
+        Slider ticks arriving while a re-render is pending are folded into it.
+        """
+        if self._zoom_pending is None:
+            self._zoom_pending = self.after(_ZOOM_THROTTLE_MS, self._apply_zoom)
+
+    def _apply_zoom(self) -> None:
+        self._zoom_pending = None
+        self.update_images_zoom()
 
     def update_images_zoom(self) -> None:
         zoom = self.zoom_var.get() if hasattr(self, "zoom_var") else 1.0
-        scale = self.scale_var.get() if hasattr(self, "scale_var") else 1.0
+        scale = self._result_scale()
         if hasattr(self, "_original_img_arr") and self._original_img_arr is not None:
             self._update_label_image(self.original_label, self._original_img_arr, zoom)
         if hasattr(self, "_result_img_arr") and self._result_img_arr is not None:
@@ -238,20 +472,65 @@ class UpscaleApp(tk.Tk):
             messagebox.showerror("Error", "No image loaded.")
             return
         method = self.method_var.get()
-        scale = self.scale_var.get()
-        self.status_var.set(f"Upscaling with {method} (scale={scale})...")
-        self.update_idletasks()
-        match method:
-            case "Nearest Neighbor":
-                self.out_image = nearest_neighbor(self.image, scale)
-            case "Bilinear":
-                self.out_image = bilinear_interpolation(self.image, scale)
-            case "Piecewise Linear":
-                self.out_image = piecewise_linear_interpolation(self.image, scale)
-            case "L2 Optimal":
-                self.out_image = l2_optimal_interpolation(self.image, scale)
+        try:
+            size = self.size_var.get().strip()
+            if size:
+                scale = scale_for_size(self.image.shape, parse_size(size))
+            else:
+                scale = parse_scale(self.scale_var.get())
+        except ValueError as exc:
+            messagebox.showerror("Error", str(exc))
+            return
+        # A new upscale replaces the one in flight.
+        self.cancel_upscale()
+        key = (self._image_id, METHOD_LABELS[method], scale)
+        cached = self._results.get(key)
+        if cached is not None:
+            self.out_image = cached
+            self.progress_var.set(100.0)
+            self.display_result(cached)
+            self.status_var.set(f"Upscaled using {method} (scale={format_scale(scale)}, cached)")
+            return
+        self._job = UpscaleJob(self.image, METHOD_LABELS[method], scale).start()
+        self.progress_var.set(0.0)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.status_var.set(f"Upscaling with {method} (scale={format_scale(scale)})...")
+        self.after(_POLL_MS, self._poll_upscale, self._job, method)
+
+    def _poll_upscale(self, job: UpscaleJob, method: str) -> None:
+        """
+        Show the progress of ``job`` and, once it finishes, its result, from the main loop.
+        """
+        if job is not self._job:
+            return  # cancelled or replaced
+        self.progress_var.set(100 * job.progress)
+        if not job.done:
+            self.after(_POLL_MS, self._poll_upscale, job, method)
+            return
+        self._job = None
+        self.cancel_btn.config(state=tk.DISABLED)
+        if job.error is not None:
+            self.status_var.set(f"Upscaling with {method} failed")
+            messagebox.showerror("Error", str(job.error))
+            return
+        # Results are shared with the cache and the views, so they are never modified.
+        job.result.setflags(write=False)
+        self._results.put((self._image_id, job.method, job.scale), job.result)
+        self.out_image = job.result
         self.display_result(self.out_image)
-        self.status_var.set(f"Upscaled using {method} (scale={scale})")
+        self.status_var.set(f"Upscaled using {method} (scale={format_scale(job.scale)})")
+
+    def cancel_upscale(self) -> None:
+        """
+        Cancel the upscale in flight, if any; its worker stops after its current band.
+        """
+        if self._job is None:
+            return
+        self._job.cancel()
+        self._job = None
+        self.progress_var.set(0.0)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.status_var.set("Upscale cancelled")
 
     def save_result(self) -> None:
         if self.out_image is not None:
@@ -1,20 +1,100 @@
+from pathlib import Path
 from typing import IO
 
 import numpy as np
 from PIL import Image
 
+# Pillow raw modes whose pixel data is a plain NumPy array: rawmode -> (dtype, channels).
+_RAW_LAYOUTS = {
+    "L": ("u1", 1),
+    "RGB": ("u1", 3),
+    "BGR": ("u1", 3),
+    "RGBA": ("u1", 4),
+    "I;16": ("<u2", 1),
+    "I;16L": ("<u2", 1),
+    "I;16B": (">u2", 1),
+    "F;32F": ("<f4", 1),
+    "F;32BF": (">f4", 1),
+}
 
-def load_image(file: str | IO | bytes) -> np.ndarray:
+
+def _map_raw(path: str | Path) -> np.memmap | None:
+    """
+    Memory-map the pixel data of an uncompressed image (PPM/PGM, raw TIFF, BMP, ...).
+
+    Returns a read-only ``np.memmap`` view, or ``None`` if the file is not stored as a
+    single uncompressed block in a layout listed in ``_RAW_LAYOUTS``.
+    """
+    with Image.open(path) as img:
+        width, height = img.size
+        tiles = img.tile
+    if len(tiles) != 1:
+        return None
+    codec, extents, offset, args = tiles[0][:4]
+    if codec != "raw" or tuple(extents) != (0, 0, width, height):
+        return None
+    rawmode, stride, orientation = (*args, 0, 1)[:3] if isinstance(args, tuple) else (args, 0, 1)
+    if rawmode not in _RAW_LAYOUTS:
+        return None
+    dtype, channels = np.dtype(_RAW_LAYOUTS[rawmode][0]), _RAW_LAYOUTS[rawmode][1]
+    pixel = channels * dtype.itemsize
+    stride = stride or width * pixel
+    if stride % dtype.itemsize:
+        return None
+    count = ((height - 1) * stride + width * pixel) // dtype.itemsize
+    data = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+    view = np.lib.stride_tricks.as_strided(
+        data,
+        shape=(height, width, channels),
+        strides=(stride, pixel, dtype.itemsize),
+        subok=True,
+        writeable=False,
+    )
+    if orientation < 0:
+        view = view[::-1]
+    if rawmode == "BGR":
+        view = view[..., ::-1]
+    return view[..., 0] if channels == 1 else view
+
+
+def load_image(file: str | IO | bytes, *, mmap: bool = False) -> np.ndarray:
     """
     Load an image from a file path or file-like object and return as a numpy array.
+
+    ``.npy`` files are loaded with NumPy. With ``mmap=True``, ``.npy`` files and
+    uncompressed images (PPM/PGM, raw TIFF, BMP) given by path are returned as read-only
+    ``np.memmap`` views of the file with no copy, keeping the file's sample type (e.g.
+    big-endian ``uint16`` for 16-bit PGM). Other inputs are decoded as usual.
     """
+    if isinstance(file, (str, Path)):
+        if Path(file).suffix == ".npy":
+            return np.load(file, mmap_mode="r" if mmap else None)
+        if mmap and (mapped := _map_raw(file)) is not None:
+            return mapped
     img = Image.open(file)
     return np.array(img)
 
 
+def open_output(path: str | Path, shape: tuple, dtype: np.dtype) -> np.memmap:
+    """
+    Create a pre-allocated, writable memory-mapped output array at ``path``.
+
+    ``.npy`` paths get a NumPy header, so the result loads back with ``np.load``; any other
+    path holds the raw sample data.
+    """
+    if Path(path).suffix == ".npy":
+        return np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+    return np.memmap(path, mode="w+", dtype=dtype, shape=shape)
+
+
 def save_image(image: np.ndarray, path: str) -> None:
     """
     Save a numpy array as an image to the specified path.
+
+    ``.npy`` paths are written directly with NumPy, without an ``Image.fromarray`` round-trip.
     """
+    if Path(path).suffix == ".npy":
+        np.save(path, image)
+        return
     img = Image.fromarray(image)
     img.save(path)
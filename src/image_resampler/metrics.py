@@ -1,34 +1,210 @@
 import numpy as np
-from skimage.metrics import mean_squared_error, peak_signal_noise_ratio, structural_similarity
 
+# Number of elements of each image converted and compared at a time by compute_metrics.
+_CHUNK_ELEMENTS = 1 << 18
 
-def compute_psnr(img1: np.ndarray, img2: np.ndarray) -> float:
+# Upper bound on the float32 working set of one row tile in ssim.
+_SSIM_TILE_BYTES = 1 << 24
+
+# Stabilizing constants of SSIM, relative to the data range.
+_K1, _K2 = 0.01, 0.03
+
+
+def _check_shapes(img1: np.ndarray, img2: np.ndarray) -> None:
     if img1.shape != img2.shape:
         msg = "Input images must have the same dimensions."
         raise ValueError(msg)
-    data_range = img1.max() - img1.min()
-    if data_range == 0:
-        return float("inf") if np.allclose(img1, img2) else float("nan")
-    return peak_signal_noise_ratio(img1, img2, data_range=data_range)
 
 
-def compute_ssim(img1: np.ndarray, img2: np.ndarray) -> float:
+def _chunk_pairs(img1: np.ndarray, img2: np.ndarray, chunk: int) -> zip:
+    """
+    Pair up matching pieces of at most ``chunk`` elements of two same-shaped images.
+
+    Contiguous images are split as flat views; other layouts are split along the first axis.
+    """
+    if img1.flags.c_contiguous and img2.flags.c_contiguous:
+        flat1, flat2 = img1.reshape(-1), img2.reshape(-1)
+        parts = [slice(i, i + chunk) for i in range(0, flat1.size, chunk)]
+        return zip((flat1[p] for p in parts), (flat2[p] for p in parts), strict=True)
+    rows = max(1, chunk // max(1, img1[:1].size))
+    parts = [slice(i, i + rows) for i in range(0, len(img1), rows)]
+    return zip((img1[p] for p in parts), (img2[p] for p in parts), strict=True)
+
+
+def compute_metrics(
+    img1: np.ndarray, img2: np.ndarray, accumulator: np.dtype = np.float64
+) -> dict[str, float]:
+    """
+    Compute the data range of ``img1``, the MSE and the PSNR of ``img2`` against it in one pass.
+
+    Both images are read once, a chunk at a time: each chunk is converted to ``accumulator``
+    (``np.float64`` or ``np.float32``), its min, max and sum of squared differences taken
+    while it is in cache, and the chunk sums added in double precision. Returns a dict with
+    ``"data_range"``, ``"mse"`` and ``"psnr"``. The PSNR is ``inf`` for identical images and
+    ``nan`` when ``img1`` is constant but ``img2`` differs.
+    """
+    _check_shapes(img1, img2)
+    if img1.size == 0:
+        return {"data_range": 0.0, "mse": float("nan"), "psnr": float("nan")}
+    lo, hi, sse = np.inf, -np.inf, 0.0
+    for part1, part2 in _chunk_pairs(img1, img2, _CHUNK_ELEMENTS):
+        a = part1.astype(accumulator).reshape(-1)
+        diff = part2.astype(accumulator).reshape(-1)
+        lo, hi = np.minimum(lo, a.min()), np.maximum(hi, a.max())
+        diff -= a
+        sse += float(np.dot(diff, diff))
+    data_range = float(hi - lo)
+    mse = sse / img1.size
+    if mse == 0:
+        psnr = float("inf")
+    elif data_range == 0:
+        psnr = float("nan")
+    else:
+        psnr = float(10 * np.log10(data_range**2 / mse))
+    return {"data_range": data_range, "mse": mse, "psnr": psnr}
+
+
+def compute_psnr(img1: np.ndarray, img2: np.ndarray) -> float:
+    return compute_metrics(img1, img2)["psnr"]
+
+
+def _window_means(x: np.ndarray, win: int) -> np.ndarray:
+    """
+    Mean over every ``win x win`` window lying fully inside ``x`` (first two axes).
+
+    A separable box filter: ``win`` shifted slices are summed down the rows, then across the
+    columns, which avoids the growing sums (and rounding) of a running sum.
+    """
+    rows, cols = x.shape[0] - win + 1, x.shape[1] - win + 1
+    acc = x[:rows].copy()
+    for k in range(1, win):
+        acc += x[k : k + rows]
+    out = acc[:, :cols].copy()
+    for k in range(1, win):
+        out += acc[:, k : k + cols]
+    out *= 1 / win**2
+    return out
+
+
+def _add_per_channel(array: np.ndarray, offset: np.ndarray) -> None:
+    """
+    Add ``offset[c]`` to channel ``c`` of a contiguous ``(rows, cols, C)`` array, in place.
+
+    The offset is tiled along each row, so the inner loop spans a whole row instead of the
+    few channels a broadcast would iterate over.
+    """
+    rows = array.reshape(array.shape[0], -1)
+    rows += np.tile(offset, array.shape[1])
+
+
+def _ssim_map_sum(  # noqa: PLR0913, PLR0917
+    x: np.ndarray, y: np.ndarray, offset: np.ndarray, win: int, c1: float, c2: float
+) -> float:
+    """
+    Sum the SSIM map of one tile over its fully covered windows.
+
+    ``x`` and ``y`` have had ``offset`` (per channel) subtracted, so the second moments are
+    formed from small values and ``E[x^2] - E[x]^2`` does not cancel away a large DC level.
+    The offset is added back only for the luminance denominator.
+    """
+    cov_norm = win**2 / (win**2 - 1) if win > 1 else 1.0
+    ux, uy = _window_means(x, win), _window_means(y, win)
+    vx = _window_means(x * x, win)
+    vx -= ux * ux
+    vy = _window_means(y * y, win)
+    vy -= uy * uy
+    vxy = _window_means(x * y, win)
+    vxy -= ux * uy
+    # Contrast-structure term (2 vxy + c2) / (vx + vy + c2).
+    vx += vy
+    vx *= cov_norm
+    vx += c2
+    vxy *= 2 * cov_norm
+    vxy += c2
+    vxy /= vx
+    # Luminance term (2 mx my + c1) / (mx^2 + my^2 + c1), with mx = ux + offset, written as
+    # 1 - (ux - uy)^2 / (mx^2 + my^2 + c1) so the difference of the means stays exact.
+    diff = ux - uy
+    diff *= diff
+    _add_per_channel(ux, offset)
+    ux *= ux
+    _add_per_channel(uy, offset)
+    uy *= uy
+    ux += uy
+    ux += c1
+    diff /= ux
+    np.subtract(1, diff, out=diff)
+    vxy *= diff
+    return float(vxy.sum(dtype=np.float64))
+
+
+def ssim(
+    img1: np.ndarray,
+    img2: np.ndarray,
+    data_range: float,
+    win_size: int = 7,
+    *,
+    tile_rows: int | None = None,
+) -> float:
+    """
+    Mean structural similarity of ``img2`` against ``img1``, ``(H, W)`` or ``(H, W, C)``.
+
+    Follows ``skimage.metrics.structural_similarity`` with its defaults (uniform
+    ``win_size x win_size`` window, sample covariance, ``K1 = 0.01``, ``K2 = 0.03``, mean
+    over windows lying fully inside the image, then over channels). Channels are processed
+    together, in float32, from separable window sums, one tile of output rows at a time:
+    each tile reads its rows plus the ``win_size - 1`` rows of window overlap, so peak memory
+    is bounded by ``tile_rows`` (default: sized to ``_SSIM_TILE_BYTES``), not the image.
+    Each tile is shifted by the per-channel mean of its ``img1`` rows (in double precision)
+    before the float32 conversion, which leaves variances and covariances unchanged but
+    keeps them accurate when the data range is small next to the pixel values. Results agree
+    with scikit-image to within ``1e-5`` absolute, the gap coming from float32 arithmetic
+    (with a tiny data range on a large level, scikit-image's unshifted float64 moments
+    themselves drift by more).
+    """
     if img1.shape != img2.shape:
         msg = "Input images must have the same dimensions."
         raise ValueError(msg)
+    if img1.ndim == 2:
+        img1, img2 = img1[..., None], img2[..., None]
+    height, width = img1.shape[:2]
+    if not 1 <= win_size <= min(height, width) or win_size % 2 == 0:
+        msg = f"win_size must be odd and at most the image size {height}x{width}."
+        raise ValueError(msg)
+    c1, c2 = (_K1 * data_range) ** 2, (_K2 * data_range) ** 2
+    out_rows = height - win_size + 1
+    if tile_rows is None:
+        # About a dozen float32 arrays of the tile's size are alive at once (the float64
+        # shifted copies made before the conversion count for two each).
+        tile_rows = max(1, _SSIM_TILE_BYTES // (12 * 4 * img1[0].size))
+    exact = np.issubdtype(img1.dtype, np.integer) and img1.dtype.itemsize <= 2
+    total = 0.0
+    for start in range(0, out_rows, tile_rows):
+        stop = min(start + tile_rows, out_rows) + win_size - 1
+        tile1, tile2 = img1[start:stop], img2[start:stop]
+        offset = tile1.mean(axis=(0, 1), dtype=np.float64)
+        if exact:
+            # Small integers and a whole offset are exact in float32, so shift there.
+            offset = np.rint(offset).astype(np.float32)
+            x, y = tile1.astype(np.float32), tile2.astype(np.float32)
+            _add_per_channel(x, -offset)
+            _add_per_channel(y, -offset)
+        else:
+            x = (tile1 - offset).astype(np.float32)
+            y = (tile2 - offset).astype(np.float32)
+        total += _ssim_map_sum(x, y, offset.astype(np.float32), win_size, c1, c2)
+    return total / (out_rows * (width - win_size + 1) * img1.shape[2])
+
+
+def compute_ssim(img1: np.ndarray, img2: np.ndarray) -> float:
+    _check_shapes(img1, img2)
     data_range = img1.max() - img1.min()
     if data_range == 0:
         return 1.0 if np.allclose(img1, img2) else float("nan")
-    channel_axis = -1 if img1.ndim == 3 else None
     min_side = min(img1.shape[0], img1.shape[1])
     win_size = 7 if min_side >= 7 else min_side if min_side % 2 == 1 else min_side - 1
-    return structural_similarity(
-        img1, img2, data_range=data_range, channel_axis=channel_axis, win_size=win_size
-    )
+    return ssim(img1, img2, float(data_range), win_size)
 
 
 def compute_mse(img1: np.ndarray, img2: np.ndarray) -> float:
-    if img1.shape != img2.shape:
-        msg = "Input images must have the same dimensions."
-        raise ValueError(msg)
-    return mean_squared_error(img1, img2)
+    return compute_metrics(img1, img2)["mse"]
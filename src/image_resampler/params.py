@@ -0,0 +1,99 @@
+import click
+
+
+def _factor(text: str) -> float:
+    value = float(text)
+    if not value > 0:
+        msg = f"scale factors must be positive, got {text!r}"
+        raise ValueError(msg)
+    return value
+
+
+def parse_scale(text: str) -> float | tuple[float, float]:
+    """
+    Parse a scale such as ``2``, ``1.5`` or ``2x3`` (width x height).
+
+    Returns a single factor, or an ``(h_scale, w_scale)`` pair as taken by the methods when
+    the two axes differ.
+    """
+    parts = str(text).lower().split("x")
+    if len(parts) == 1:
+        return _factor(parts[0])
+    if len(parts) == 2:
+        w_scale, h_scale = _factor(parts[0]), _factor(parts[1])
+        return w_scale if w_scale == h_scale else (h_scale, w_scale)
+    msg = f"invalid scale {text!r}, expected a factor such as 2 or 1.5, or WxH such as 2x3"
+    raise ValueError(msg)
+
+
+def parse_size(text: str) -> tuple[int, int]:
+    """
+    Parse a target size ``WxH`` such as ``1920x1080`` into ``(width, height)``.
+    """
+    try:
+        width, height = (int(part) for part in str(text).lower().split("x"))
+    except ValueError:
+        width = height = 0
+    if width < 1 or height < 1:
+        msg = f"invalid size {text!r}, expected WxH such as 1920x1080"
+        raise ValueError(msg)
+    return width, height
+
+
+def format_scale(scale) -> str:
+    """
+    Format a scale for display: ``1.5``, or ``2x3`` (width x height) for a pair.
+    """
+    if isinstance(scale, tuple):
+        h_scale, w_scale = scale
+        return f"{w_scale:g}x{h_scale:g}"
+    return f"{scale:g}"
+
+
+def scale_for_size(shape: tuple, size: tuple[int, int]) -> float | tuple[float, float]:
+    """
+    Return the scale that resamples an image of ``shape`` to ``size`` (width, height).
+    """
+    width, height = size
+    h_scale, w_scale = height / shape[0], width / shape[1]
+    return h_scale if h_scale == w_scale else (h_scale, w_scale)
+
+
+class ScaleType(click.ParamType):
+    """
+    Click parameter type for :func:`parse_scale`.
+    """
+
+    name = "scale"
+
+    def convert(
+        self, value: object, param: click.Parameter | None, ctx: click.Context | None
+    ) -> float | tuple[float, float]:
+        if isinstance(value, (int, float, tuple)):
+            return value
+        try:
+            return parse_scale(value)
+        except ValueError as exc:
+            self.fail(str(exc), param, ctx)
+
+
+class SizeType(click.ParamType):
+    """
+    Click parameter type for :func:`parse_size`.
+    """
+
+    name = "WxH"
+
+    def convert(
+        self, value: object, param: click.Parameter | None, ctx: click.Context | None
+    ) -> tuple[int, int]:
+        if isinstance(value, tuple):
+            return value
+        try:
+            return parse_size(value)
+        except ValueError as exc:
+            self.fail(str(exc), param, ctx)
+
+
+SCALE = ScaleType()
+SIZE = SizeType()
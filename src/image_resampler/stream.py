@@ -0,0 +1,164 @@
+import sys
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from pathlib import Path
+from typing import IO
+
+import click
+import numpy as np
+
+from .batch import _image_files
+from .io import load_image, save_image
+from .methods import (
+    _SEPARABLE_METHODS,
+    METHODS,
+    _check_single_image,
+    _resample_plan,
+    _resampled_shape,
+    _scale_pair,
+)
+from .params import SCALE, SIZE, scale_for_size
+
+
+def upscale_stream(
+    frames: Iterable[np.ndarray],
+    method: str,
+    scale,
+    *,
+    out: np.ndarray | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    Upscale a sequence of same-shaped ``(H, W)`` or ``(H, W, C)`` frames, yielding each result.
+
+    The tap tables are looked up once from the first frame and the output buffer is
+    allocated once, so no per-frame index or weight setup or output allocation takes place.
+    Every frame is written into the same buffer (``out`` if given, which may have any dtype,
+    see :func:`~image_resampler.methods.nearest_neighbor`, otherwise the frames' dtype in
+    native byte order), so a yielded frame is only valid until the next one is requested;
+    copy it to keep it.
+    """
+    if method not in METHODS:
+        msg = f"Unknown method '{method}'."
+        raise ValueError(msg)
+    frames = iter(frames)
+    first = next(frames, None)
+    if first is None:
+        return
+    _check_single_image(first)
+    if method in _SEPARABLE_METHODS:
+        kernel, engine = _SEPARABLE_METHODS[method]
+        h_scale, w_scale = _scale_pair(scale)
+        row_taps, col_taps = _resample_plan(kernel, first, h_scale, w_scale)
+        out_shape = (len(row_taps[0]), len(col_taps[0]), *first.shape[2:])
+    else:
+        out_shape = _resampled_shape(first.shape, scale)
+    if out is None:
+        out = np.empty(out_shape, dtype=first.dtype.newbyteorder("="))
+    elif out.shape != out_shape:
+        msg = f"Output array must have shape {out_shape}."
+        raise ValueError(msg)
+    for frame in chain([first], frames):
+        if frame.shape != first.shape or frame.dtype != first.dtype:
+            msg = f"All frames must have shape {first.shape} and dtype {first.dtype}."
+            raise ValueError(msg)
+        if method in _SEPARABLE_METHODS:
+            engine(frame, row_taps, col_taps, out)
+        else:
+            METHODS[method](frame, scale, out=out)
+        yield out
+
+
+def read_raw_frames(stream: IO[bytes], shape: tuple, dtype: np.dtype) -> Iterator[np.ndarray]:
+    """
+    Read back-to-back raw frames of ``shape`` and ``dtype`` from a binary stream.
+
+    Frames are read into one reused buffer, which is yielded each time. Raises
+    ``ValueError`` if the stream ends partway through a frame.
+    """
+    frame = np.empty(shape, dtype=dtype)
+    buffer = memoryview(frame).cast("B")
+    while True:
+        filled = 0
+        while filled < frame.nbytes:
+            count = stream.readinto(buffer[filled:])
+            if not count:
+                break
+            filled += count
+        if filled == 0:
+            return
+        if filled < frame.nbytes:
+            msg = f"Stream ended partway through a frame ({filled} of {frame.nbytes} bytes)."
+            raise ValueError(msg)
+        yield frame
+
+
+def _parse_shape(value: str) -> tuple[int, ...]:
+    """
+    Parse a frame shape such as ``480x640`` or ``480x640x3``.
+    """
+    try:
+        shape = tuple(int(part) for part in value.lower().split("x"))
+    except ValueError:
+        shape = ()
+    if len(shape) not in {2, 3} or min(shape) < 1:
+        msg = f"Invalid frame shape '{value}', expected HxW or HxWxC."
+        raise click.BadParameter(msg)
+    return shape
+
+
+@click.command()
+@click.argument("source")
+@click.argument("destination")
+@click.option(
+    "-m", "--method", type=click.Choice(list(METHODS)), default="bl", help="Interpolation method."
+)
+@click.option(
+    "-s", "--scale", type=SCALE, default="2", help="Scaling factor, e.g. 2, 1.5 or 2x3 (WxH)."
+)
+@click.option("--size", type=SIZE, help="Target size WxH, e.g. 1920x1080. Overrides --scale.")
+@click.option("--shape", help="Frame shape HxW or HxWxC of raw frames read from stdin.")
+@click.option("--dtype", default="uint8", show_default=True, help="Sample type of raw frames.")
+def stream(  # noqa: PLR0913
+    source: str,
+    destination: str,
+    *,
+    method: str,
+    scale: float | tuple[float, float],
+    size: tuple[int, int] | None,
+    shape: str | None,
+    dtype: str,
+) -> None:
+    """Upscale a frame sequence from SOURCE to DESTINATION.
+
+    SOURCE is a directory of same-sized frames, read in name order, or - for raw frames on
+    stdin (requires --shape). DESTINATION is a directory, where frames keep their names
+    (frames from stdin are numbered), or - for raw frames on stdout.
+    """
+    if source == "-":
+        if shape is None:
+            msg = "Reading raw frames from stdin requires --shape."
+            raise click.UsageError(msg)
+        names = (f"frame_{i:06d}.png" for i in range(sys.maxsize))
+        frames = read_raw_frames(sys.stdin.buffer, _parse_shape(shape), np.dtype(dtype))
+    else:
+        paths = _image_files(Path(source))
+        names = (path.name for path in paths)
+        frames = (load_image(path, mmap=True) for path in paths)
+    if size is not None and (first := next(frames, None)) is not None:
+        scale = scale_for_size(first.shape, size)
+        frames = chain([first], frames)
+    results = upscale_stream(frames, method, scale)
+    try:
+        if destination == "-":
+            sink = sys.stdout.buffer
+            for out in results:
+                sink.write(memoryview(out).cast("B"))
+            sink.flush()
+            return
+        output_dir = Path(destination)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for name, out in zip(names, results, strict=False):
+            save_image(out, str(output_dir / name))
+    except ValueError as exc:
+        # A frame of another shape or dtype, or a truncated raw stream.
+        raise click.ClickException(str(exc)) from exc
@@ -0,0 +1,113 @@
+import threading
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from PIL import Image
+
+from image_resampler import batch as batch_module
+from image_resampler.batch import batch, run_batch
+from image_resampler.methods import bilinear_interpolation
+
+
+def _write_images(directory, count) -> list:
+    rng = np.random.default_rng(0)
+    arrays = []
+    for i in range(count):
+        arr = rng.integers(0, 256, (6 + i, 5, 3), dtype=np.uint8)
+        Image.fromarray(arr).save(directory / f"img_{i}.png")
+        arrays.append(arr)
+    return arrays
+
+
+def test_batch_command(tmp_path) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    arrays = _write_images(src, 5)
+    (src / "notes.txt").write_text("not an image")
+    result = CliRunner().invoke(batch, [str(src), str(dst), "-m", "bl", "-s", "2"])
+    assert result.exit_code == 0, result.output
+    assert "Upscaled 5/5 images" in result.output
+    assert "images/s" in result.output
+    assert "MB/s" in result.output
+    for i, arr in enumerate(arrays):
+        out = np.array(Image.open(dst / f"img_{i}.png"))
+        assert np.array_equal(out, bilinear_interpolation(arr, 2))
+
+
+def test_batch_l2_converts_dtype(tmp_path) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    _write_images(src, 2)
+    stats = run_batch(sorted(src.iterdir()), dst, "l2", 2, io_workers=1, queue_size=1)
+    assert stats["processed"] == 2
+    assert not stats["failures"]
+    assert np.array(Image.open(dst / "img_0.png")).dtype == np.uint8
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch_16bit_pgm(tmp_path, jobs) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    arr = np.random.default_rng(0).integers(0, 65536, (6, 5), dtype=np.uint16)
+    Image.fromarray(arr).save(src / "img.pgm")
+    stats = run_batch([src / "img.pgm"], dst, "bl", 2, jobs=jobs)
+    assert not stats["failures"]
+    assert np.array_equal(np.array(Image.open(dst / "img.pgm")), bilinear_interpolation(arr, 2))
+
+
+def test_batch_fractional_scale_and_size(tmp_path) -> None:
+    src = tmp_path / "in"
+    src.mkdir()
+    _write_images(src, 2)
+    runner = CliRunner()
+    result = runner.invoke(batch, [str(src), str(tmp_path / "a"), "-s", "1.5"])
+    assert result.exit_code == 0, result.output
+    assert Image.open(tmp_path / "a" / "img_1.png").size == (8, 10)
+    result = runner.invoke(batch, [str(src), str(tmp_path / "b"), "--size", "9x4"])
+    assert result.exit_code == 0, result.output
+    assert all(Image.open(path).size == (9, 4) for path in (tmp_path / "b").iterdir())
+    result = runner.invoke(batch, [str(src), str(tmp_path / "c"), "-s", "0"])
+    assert result.exit_code == 2
+
+
+def test_batch_interrupt_joins_threads(tmp_path, monkeypatch) -> None:
+    src = tmp_path / "in"
+    src.mkdir()
+    _write_images(src, 10)
+
+    def interrupt(*_args: object, **_kwargs: object) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setitem(batch_module.METHODS, "bl", interrupt)
+    threads = threading.active_count()
+    errors = []
+
+    def run() -> None:
+        try:
+            run_batch(sorted(src.iterdir()), tmp_path / "out", "bl", 2, queue_size=1)
+        except KeyboardInterrupt as exc:
+            errors.append(exc)
+
+    runner = threading.Thread(target=run, daemon=True)
+    runner.start()
+    runner.join(timeout=10)
+    assert not runner.is_alive()
+    assert len(errors) == 1
+    assert threading.active_count() == threads
+
+
+def test_batch_reports_failures(tmp_path) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    _write_images(src, 2)
+    (src / "broken.png").write_text("not an image")
+    result = CliRunner().invoke(batch, [str(src), str(dst), "--io-workers", "3"])
+    assert result.exit_code == 1
+    assert "Failed: broken.png" in result.output
+    assert "Upscaled 2/3 images" in result.output
+
+
+def test_batch_rejects_negative_jobs(tmp_path) -> None:
+    result = CliRunner().invoke(batch, [str(tmp_path), str(tmp_path / "out"), "-j", "-1"])
+    assert result.exit_code == 2
@@ -1,3 +1,5 @@
+import json
+
 import numpy as np
 from click.testing import CliRunner
 
@@ -19,14 +21,13 @@ def test_benchmark_runs(monkeypatch, tmp_path) -> None:
     img_path = tmp_path / "dummy.png"
     Image.fromarray(arr).save(img_path)
     # Patch methods to return the input
-    monkeypatch.setattr(benchmark, "nearest_neighbor", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "bilinear_interpolation", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "piecewise_linear_interpolation", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "l2_optimal_interpolation", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "nn", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "bl", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "pw", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "l2", lambda arr, _: arr)
     # Patch metrics to avoid actual computation
-    monkeypatch.setattr(benchmark, "compute_psnr", lambda *_: 1)
+    monkeypatch.setattr(benchmark, "compute_metrics", lambda *_: {"psnr": 1, "mse": 1})
     monkeypatch.setattr(benchmark, "compute_ssim", lambda *_: 1)
-    monkeypatch.setattr(benchmark, "compute_mse", lambda *_: 1)
     # Patch resize to identity
     monkeypatch.setattr(benchmark, "resize", lambda arr, *a, **k: arr)  # noqa: ARG005
     runner = CliRunner()
@@ -35,6 +36,7 @@ def test_benchmark_runs(monkeypatch, tmp_path) -> None:
     assert "Nearest Neighbor" in result.output
     assert "Bilinear" in result.output
     assert "Piecewise Linear" in result.output
+    assert "Lanczos-3" in result.output
     assert "L2 Optimal" in result.output
 
 
@@ -46,35 +48,29 @@ def test_benchmark_metrics_called(monkeypatch, tmp_path) -> None:
     img_path = tmp_path / "dummy.png"
     Image.fromarray(arr).save(img_path)
 
-    called = {"psnr": 0, "ssim": 0, "mse": 0}
+    called = {"metrics": 0, "ssim": 0}
 
-    def fake_metric(*args: object, **kwargs: object) -> float:  # noqa: ARG001
-        called["psnr"] += 1
-        return 42.0
+    def fake_metrics(*args: object, **kwargs: object) -> dict:  # noqa: ARG001
+        called["metrics"] += 1
+        return {"psnr": 42.0, "mse": 1.0}
 
     def fake_ssim(*args: object, **kwargs: object) -> float:  # noqa: ARG001
         called["ssim"] += 1
         return 0.9
 
-    def fake_mse(*args: object, **kwargs: object) -> float:  # noqa: ARG001
-        called["mse"] += 1
-        return 1.0
-
-    monkeypatch.setattr(benchmark, "compute_psnr", fake_metric)
+    monkeypatch.setattr(benchmark, "compute_metrics", fake_metrics)
     monkeypatch.setattr(benchmark, "compute_ssim", fake_ssim)
-    monkeypatch.setattr(benchmark, "compute_mse", fake_mse)
-    monkeypatch.setattr(benchmark, "nearest_neighbor", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "bilinear_interpolation", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "piecewise_linear_interpolation", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "l2_optimal_interpolation", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "nn", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "bl", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "pw", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "l2", lambda arr, _: arr)
     monkeypatch.setattr(benchmark, "resize", lambda arr, *a, **k: arr)  # noqa: ARG005
     runner = CliRunner()
     result = runner.invoke(benchmark.benchmark, [str(img_path)])
     assert result.exit_code == 0
-    # Each metric should be called once per method (4 methods)
-    assert called["psnr"] == 4
-    assert called["ssim"] == 4
-    assert called["mse"] == 4
+    # PSNR/MSE (one fused pass) and SSIM are computed once per method (7 methods)
+    assert called["metrics"] == 7
+    assert called["ssim"] == 7
 
 
 def test_benchmark_downscale(monkeypatch, tmp_path) -> None:
@@ -91,13 +87,12 @@ def test_benchmark_downscale(monkeypatch, tmp_path) -> None:
         shapes.append(arr.shape)
         return arr
 
-    monkeypatch.setattr(benchmark, "nearest_neighbor", fake_method)
-    monkeypatch.setattr(benchmark, "bilinear_interpolation", fake_method)
-    monkeypatch.setattr(benchmark, "piecewise_linear_interpolation", fake_method)
-    monkeypatch.setattr(benchmark, "l2_optimal_interpolation", fake_method)
-    monkeypatch.setattr(benchmark, "compute_psnr", lambda *_: 1)
+    monkeypatch.setitem(benchmark.METHODS, "nn", fake_method)
+    monkeypatch.setitem(benchmark.METHODS, "bl", fake_method)
+    monkeypatch.setitem(benchmark.METHODS, "pw", fake_method)
+    monkeypatch.setitem(benchmark.METHODS, "l2", fake_method)
+    monkeypatch.setattr(benchmark, "compute_metrics", lambda *_: {"psnr": 1, "mse": 1})
     monkeypatch.setattr(benchmark, "compute_ssim", lambda *_: 1)
-    monkeypatch.setattr(benchmark, "compute_mse", lambda *_: 1)
     monkeypatch.setattr(
         benchmark,
         "resize",
@@ -139,14 +134,13 @@ def test_benchmark_invalid_scale(monkeypatch, tmp_path) -> None:
     img_path = tmp_path / "dummy.png"
     Image.fromarray(arr).save(img_path)
     # Patch methods to avoid actual computation
-    monkeypatch.setattr(benchmark, "nearest_neighbor", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "bilinear_interpolation", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "piecewise_linear_interpolation", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "l2_optimal_interpolation", lambda arr, _: arr)
-    monkeypatch.setattr(benchmark, "compute_psnr", lambda *_: 1)
+    monkeypatch.setitem(benchmark.METHODS, "nn", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "bl", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "pw", lambda arr, _: arr)
+    monkeypatch.setitem(benchmark.METHODS, "l2", lambda arr, _: arr)
+    monkeypatch.setattr(benchmark, "compute_metrics", lambda *_: {"psnr": 1, "mse": 1})
     monkeypatch.setattr(benchmark, "compute_ssim", lambda *_: 1)
-    monkeypatch.setattr(benchmark, "compute_mse", lambda *_: 1)
-    monkeypatch.setattr(benchmark, "resize", lambda arr, *_: arr)
+    monkeypatch.setattr(benchmark, "resize", lambda arr, *_, **__: arr)
     runner = CliRunner()
     # Use scale 0 (invalid)
     result = runner.invoke(benchmark.benchmark, [str(img_path), "--scale", "0"])
@@ -159,3 +153,198 @@ def test_benchmark_invalid_scale(monkeypatch, tmp_path) -> None:
         )
     else:
         assert result.exception is not None
+
+
+def test_benchmark_jobs(monkeypatch, tmp_path) -> None:
+    from PIL import Image
+
+    arr = np.random.default_rng().integers(0, 255, (16, 16), dtype="uint8")
+    img_path = tmp_path / "dummy.png"
+    Image.fromarray(arr).save(img_path)
+    keys = []
+
+    def fake_parallel(image, key, _scale, workers) -> np.ndarray:
+        keys.append((key, workers))
+        return image
+
+    monkeypatch.setattr(benchmark, "upscale_parallel", fake_parallel)
+    monkeypatch.setattr(benchmark, "compute_metrics", lambda *_: {"psnr": 1, "mse": 1})
+    monkeypatch.setattr(benchmark, "compute_ssim", lambda *_: 1)
+    monkeypatch.setattr(benchmark, "resize", lambda arr, *a, **k: arr)  # noqa: ARG005
+    result = CliRunner().invoke(benchmark.benchmark, [str(img_path), "--jobs", "2"])
+    assert result.exit_code == 0
+    assert list(dict.fromkeys(keys)) == [
+        ("nn", 2),
+        ("bl", 2),
+        ("pw", 2),
+        ("bc", 2),
+        ("lz", 2),
+        ("mn", 2),
+        ("l2", 2),
+    ]
+
+
+def _patch_fast(monkeypatch) -> None:
+    monkeypatch.setattr(benchmark, "compute_metrics", lambda *_: {"psnr": float("inf"), "mse": 0.0})
+    monkeypatch.setattr(benchmark, "compute_ssim", lambda *_: 1.0)
+    monkeypatch.setattr(benchmark, "resize", lambda arr, *a, **k: arr)  # noqa: ARG005
+
+
+def test_benchmark_warmup_and_repeat(monkeypatch, tmp_path) -> None:
+    from PIL import Image
+
+    arr = np.random.default_rng().integers(0, 255, (16, 16), dtype="uint8")
+    img_path = tmp_path / "dummy.png"
+    Image.fromarray(arr).save(img_path)
+    calls = []
+
+    def counting(arr, _) -> np.ndarray:
+        calls.append(1)
+        return arr
+
+    for key in benchmark.METHODS:
+        monkeypatch.setitem(benchmark.METHODS, key, counting)
+    _patch_fast(monkeypatch)
+    result = CliRunner().invoke(
+        benchmark.benchmark, [str(img_path), "--warmup", "2", "--repeat", "3"]
+    )
+    assert result.exit_code == 0
+    # warmup + repeat + one traced run, for each of the 7 methods
+    assert len(calls) == 7 * (2 + 3 + 1)
+    assert "p95=" in result.output
+
+
+def test_benchmark_json_and_csv(monkeypatch, tmp_path) -> None:
+    import csv
+    import json
+
+    from PIL import Image
+
+    arr = np.random.default_rng().integers(0, 255, (16, 16), dtype="uint8")
+    img_path = tmp_path / "dummy.png"
+    Image.fromarray(arr).save(img_path)
+    _patch_fast(monkeypatch)
+    runner = CliRunner()
+    result = runner.invoke(benchmark.benchmark, [str(img_path), "-f", "json", "--repeat", "2"])
+    assert result.exit_code == 0
+    records = json.loads(result.output)
+    assert [r["key"] for r in records] == ["nn", "bl", "pw", "bc", "lz", "mn", "l2"]
+    for record in records:
+        assert record["time_min_s"] <= record["time_median_s"] <= record["time_p95_s"]
+        assert record["peak_memory_bytes"] > 0
+        assert record["psnr"] is None
+    out_csv = tmp_path / "results.csv"
+    result = runner.invoke(benchmark.benchmark, [str(img_path), "-f", "csv", "-o", str(out_csv)])
+    assert result.exit_code == 0
+    with out_csv.open() as f:
+        rows = list(csv.DictReader(f))
+    assert [r["method"] for r in rows] == [
+        "Nearest Neighbor",
+        "Bilinear",
+        "Piecewise Linear",
+        "Bicubic",
+        "Lanczos-3",
+        "Mitchell",
+        "L2 Optimal",
+    ]
+    assert set(rows[0]) == set(benchmark.FIELDS)
+
+
+def test_timing_stats() -> None:
+    stats = benchmark.timing_stats([1_000_000_000, 2_000_000_000, 3_000_000_000])
+    assert stats["time_min_s"] == 1.0
+    assert stats["time_median_s"] == 2.0
+    assert 2.0 < stats["time_p95_s"] <= 3.0
+
+
+def test_synthetic_image_layouts() -> None:
+    gray = benchmark.synthetic_image(16, 1, "uint8")
+    assert gray.shape == (16, 16)
+    assert gray.dtype == np.uint8
+    rgba = benchmark.synthetic_image(16, 4, "uint16")
+    assert rgba.shape == (16, 16, 4)
+    assert rgba.max() > 255
+    floats = benchmark.synthetic_image(8, 3, "float32")
+    assert floats.dtype == np.float32
+    assert 0.0 <= floats.min() <= floats.max() <= 1.0
+
+
+def test_benchmark_suite_matrix() -> None:
+    import json
+
+    result = CliRunner().invoke(
+        benchmark.benchmark_suite,
+        [
+            "--sizes",
+            "8,16",
+            "--channels",
+            "1,3",
+            "--dtypes",
+            "uint8,float32",
+            "--scales",
+            "1.5,2",
+            "--repeat",
+            "1",
+            "--warmup",
+            "0",
+            "--max-output-megapixels",
+            "0.0005",
+            "-f",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    records = json.loads(result.output)
+    assert len(records) == 2 * 2 * 2 * 2 * 7
+    statuses = {(r["method"], r["size"], r["scale"]): r["status"] for r in records}
+    assert statuses[("l2", 8, 1.5)] == "ok"
+    assert statuses[("bl", 16, 2.0)] == "skipped"
+    assert statuses[("bl", 8, 2.0)] == "ok"
+    ok = [r for r in records if r["status"] == "ok"]
+    assert all(r["megapixels_per_s"] > 0 for r in ok)
+
+
+def test_benchmark_suite_skips_synthesis_of_skipped_inputs(monkeypatch) -> None:
+    sizes = []
+    original = benchmark.synthetic_image
+
+    def tracking(size: int, *args: object) -> np.ndarray:
+        sizes.append(size)
+        return original(size, *args)
+
+    monkeypatch.setattr(benchmark, "synthetic_image", tracking)
+    records = benchmark.run_suite(
+        [8, 64], [1], ["uint8"], [2], ["nn"], warmup=0, repeat=1, max_output_megapixels=0.001
+    )
+    assert [r["status"] for r in records] == ["ok", "skipped"]
+    assert sizes == [8]
+
+
+def test_benchmark_suite_rejects_bad_lists() -> None:
+    runner = CliRunner()
+    result = runner.invoke(benchmark.benchmark_suite, ["--methods", "nn,xx"])
+    assert result.exit_code != 0
+    assert "unknown method" in result.output
+    result = runner.invoke(benchmark.benchmark_suite, ["--sizes", "a,b"])
+    assert result.exit_code != 0
+
+
+def test_benchmark_fractional_scale_and_size(tmp_path) -> None:
+    from PIL import Image
+
+    arr = np.random.default_rng(0).integers(0, 255, (24, 36, 3), dtype="uint8")
+    img_path = tmp_path / "dummy.png"
+    Image.fromarray(arr).save(img_path)
+    runner = CliRunner()
+    result = runner.invoke(
+        benchmark.benchmark, [str(img_path), "-s", "1.5", "-f", "json", "--repeat", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    records = json.loads(result.stdout)
+    assert [r["key"] for r in records] == ["nn", "bl", "pw", "bc", "lz", "mn", "l2"]
+    result = runner.invoke(
+        benchmark.benchmark, [str(img_path), "--size", "12x8", "-f", "json", "--repeat", "1"]
+    )
+    assert result.exit_code == 0, result.output
+    records = json.loads(result.stdout)
+    assert [r["scale"] for r in records] == [3.0] * 7
@@ -66,9 +66,9 @@ def test_cli_upscale_invalid_method(tmp_path, runner: CliRunner) -> None:
     img = (rng.random((8, 8)) * 255).astype("uint8")
     img_path = tmp_path / "dummy.png"
     Image.fromarray(img).save(img_path)
-    with img_path.open("rb") as f:
-        result = runner.invoke(cli, ["upscale", "-m", "invalid"], input=f.read())
-    assert result.exit_code != 0 or "Incorrect" in result.output
+    result = runner.invoke(cli, ["upscale", str(img_path), "-m", "invalid"])
+    assert result.exit_code == 2
+    assert "Invalid value for '-m' / '--method'" in result.output
 
 
 def test_main_entrypoint(monkeypatch) -> None:
@@ -126,3 +126,47 @@ def test_io_imports() -> None:
 
 def test_gui_imports() -> None:
     pass
+
+
+HEAVY_MODULES = ("matplotlib", "tkinter", "PIL.ImageTk", "skimage")
+
+
+def _run_python(code: str) -> str:
+    import os
+    import subprocess
+    import sys
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    return result.stdout
+
+
+def test_cli_import_is_light() -> None:
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import image_resampler.cli\n"
+        "print(time.perf_counter() - start)\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    elapsed, heavy = _run_python(code).splitlines()
+    assert heavy == "[]"
+    # Generous bound: numpy + click + Pillow import well under this on any CI machine.
+    assert float(elapsed) < 2.0
+
+
+def test_cli_headless_upscale_imports(tmp_path) -> None:
+    import numpy as np
+    from PIL import Image
+
+    img_path = tmp_path / "dummy.png"
+    Image.fromarray(np.zeros((8, 8), dtype=np.uint8)).save(img_path)
+    code = (
+        "import sys\n"
+        "from image_resampler.cli import cli\n"
+        f"cli(['upscale', {str(img_path)!r}, '-m', 'bl', '--no-show'], standalone_mode=False)\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    assert _run_python(code).strip() == "[]"
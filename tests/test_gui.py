@@ -1,6 +1,12 @@
 import contextlib
+from collections.abc import Callable
 
-from image_resampler.gui import UpscaleApp
+import numpy as np
+import pytest
+
+from image_resampler import gui
+from image_resampler.gui import ResultCache, UpscaleApp, UpscaleJob, ViewCache
+from image_resampler.methods import METHODS
 
 
 def test_gui_instantiates(monkeypatch) -> None:
@@ -104,3 +110,95 @@ def test_gui_save_result_success(monkeypatch, tmp_path) -> None:
 
     app.out_image = np.ones((8, 8), dtype=np.uint8)
     app.save_result()
+
+
+@pytest.mark.parametrize("method", ["bl", "lz", "l2"])
+def test_upscale_job_runs_in_background(method, monkeypatch) -> None:
+    monkeypatch.setattr(gui, "_BAND_ROWS", 8)
+    image = np.random.default_rng(0).integers(0, 256, (20, 12, 3), dtype=np.uint8)
+    job = UpscaleJob(image, method, 2).start()
+    job.wait()
+    assert job.done
+    assert job.error is None
+    assert job.progress == 1.0
+    # Results keep the input dtype so they can be displayed.
+    assert np.array_equal(job.result, METHODS[method](image, 2, output_dtype=np.uint8))
+
+
+def test_upscale_job_cancel_and_error() -> None:
+    image = np.zeros((40, 40), dtype=np.uint8)
+    job = UpscaleJob(image, "bl", 2)
+    job.cancel()
+    job.start().wait()
+    # The worker stops after its first band.
+    assert job.cancelled
+    assert job.result is None
+    assert 0 < job.progress < 1
+    job = UpscaleJob(image, "l2", -1).start()
+    job.wait()
+    assert isinstance(job.error, ValueError)
+
+
+# Zooms without exact half-pixel ties, which Pillow may break the other way.
+@pytest.mark.parametrize("zoom", [0.25, 0.7, 1.0, 3.0, 16.0])
+def test_zoom_viewport_matches_full_resize(zoom) -> None:
+    from PIL import Image
+
+    image = np.random.default_rng(1).integers(0, 256, (90, 130, 3), dtype=np.uint8)
+    view = gui.zoom_viewport(image, zoom, size=(40, 30))
+    full = Image.fromarray(image)
+    new_w, new_h = max(1, int(130 * zoom)), max(1, int(90 * zoom))
+    full = full.resize((new_w, new_h), Image.NEAREST)
+    left, upper = max(0, (new_w - 40) // 2), max(0, (new_h - 30) // 2)
+    expected = np.asarray(full.crop((left, upper, min(left + 40, new_w), min(upper + 30, new_h))))
+    assert np.array_equal(view, expected)
+
+
+def test_zoom_viewport_cost_is_independent_of_zoom() -> None:
+    image = np.zeros((4000, 6000), dtype=np.uint8)
+    assert gui.zoom_viewport(image, 16.0).shape == (400, 400)
+    assert gui.zoom_viewport(image, 0.01).shape == (40, 60)
+
+
+def test_result_cache_budget_and_lru() -> None:
+    cache = ResultCache(budget_bytes=300)
+    a, b, c = (np.zeros(100, dtype=np.uint8) for _ in range(3))
+    cache.put((0, "bl", 2), a)
+    cache.put((0, "l2", 2), b)
+    cache.put((0, "nn", 2), c)
+    assert cache.nbytes == 300
+    # Results are stored as they are, without copies.
+    assert cache.get((0, "bl", 2)) is a
+    cache.put((0, "pw", 2), np.zeros(150, dtype=np.uint8))
+    # The least recently used results are evicted to fit the budget.
+    assert cache.get((0, "l2", 2)) is None
+    assert cache.get((0, "nn", 2)) is None
+    assert cache.get((0, "bl", 2)) is a
+    assert cache.nbytes == 250
+    cache.put((0, "big", 2), np.zeros(301, dtype=np.uint8))
+    assert cache.get((0, "big", 2)) is None
+    assert len(cache) == 2
+    cache.put((0, "bl", 2), c)
+    assert cache.nbytes == 250
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_view_cache_lru() -> None:
+    cache = ViewCache(maxsize=2)
+    renders = []
+
+    def render(name: str) -> Callable[[], str]:
+        return lambda: renders.append(name) or name
+
+    assert cache.get(("a", 1.0), render("a")) == "a"
+    assert cache.get(("b", 1.0), render("b")) == "b"
+    assert cache.get(("a", 1.0), render("a2")) == "a"
+    cache.get(("c", 1.0), render("c"))
+    # The least recently used view is evicted.
+    assert len(cache) == 2
+    assert cache.get(("b", 1.0), render("b2")) == "b2"
+    assert renders == ["a", "b", "c", "b2"]
+    cache.clear()
+    assert len(cache) == 0
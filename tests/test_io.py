@@ -3,7 +3,7 @@ from pathlib import Path
 import numpy as np
 from PIL import Image
 
-from image_resampler.io import load_image, save_image
+from image_resampler.io import load_image, open_output, save_image
 
 
 def test_load_image_and_save_image(tmp_path) -> None:
@@ -28,3 +28,47 @@ def test_load_image_filelike(tmp_path) -> None:
     with Path.open(file_path, "rb") as f:
         loaded = load_image(f)
         assert np.allclose(loaded, arr)
+
+
+def test_load_image_mmap_uncompressed(tmp_path) -> None:
+    rng = np.random.default_rng(0)
+    rgb = rng.integers(0, 255, (9, 7, 3), dtype=np.uint8)
+    gray16 = rng.integers(0, 65535, (6, 5), dtype=np.uint16)
+    cases = {
+        "img.ppm": rgb,
+        "img.pgm": rgb[..., 0],
+        "img16.pgm": gray16,
+        "img.tif": rgb,
+        "img16.tif": gray16,
+        "img.bmp": rgb,
+    }
+    for name, arr in cases.items():
+        path = tmp_path / name
+        Image.fromarray(arr).save(path)
+        loaded = load_image(str(path), mmap=True)
+        assert isinstance(loaded, np.memmap), name
+        assert not loaded.flags.writeable
+        assert np.array_equal(loaded, arr), name
+
+
+def test_load_image_mmap_falls_back_to_decoding(tmp_path) -> None:
+    arr = np.random.default_rng(1).integers(0, 255, (8, 8, 3), dtype=np.uint8)
+    path = tmp_path / "img.png"
+    Image.fromarray(arr).save(path)
+    loaded = load_image(path, mmap=True)
+    assert not isinstance(loaded, np.memmap)
+    assert np.array_equal(loaded, arr)
+
+
+def test_npy_round_trip_and_open_output(tmp_path) -> None:
+    arr = np.random.default_rng(2).random((4, 5, 3)).astype(np.float32)
+    path = tmp_path / "img.npy"
+    save_image(arr, str(path))
+    assert np.array_equal(load_image(str(path)), arr)
+    mapped = load_image(str(path), mmap=True)
+    assert isinstance(mapped, np.memmap)
+    assert np.array_equal(mapped, arr)
+    out = open_output(tmp_path / "out.npy", (3, 2), np.uint16)
+    out[...] = 7
+    out.flush()
+    assert np.array_equal(np.load(tmp_path / "out.npy"), np.full((3, 2), 7, dtype=np.uint16))
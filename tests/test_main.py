@@ -1,6 +1,8 @@
 import importlib
 import sys
 
+import pytest
+
 
 def test_main_entrypoint(monkeypatch) -> None:
     # Patch click.echo to capture output
@@ -24,20 +26,14 @@ def test_main_function(monkeypatch) -> None:
 
     monkeypatch.setattr(main_mod, "load_image", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
     monkeypatch.setattr(main_mod, "save_image", lambda *_a, **_k: None)
-    monkeypatch.setattr(
-        main_mod, "nearest_neighbor", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
-    monkeypatch.setattr(
-        main_mod, "bilinear_interpolation", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
-    monkeypatch.setattr(
-        main_mod,
-        "piecewise_linear_interpolation",
+    monkeypatch.setitem(main_mod.METHODS, "nn", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
+    monkeypatch.setitem(main_mod.METHODS, "bl", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
+    monkeypatch.setitem(
+        main_mod.METHODS,
+        "pw",
         lambda *_a, **_k: __import__("numpy").zeros((8, 8)),
     )
-    monkeypatch.setattr(
-        main_mod, "l2_optimal_interpolation", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
+    monkeypatch.setitem(main_mod.METHODS, "l2", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
     import matplotlib.pyplot as plt
 
     monkeypatch.setattr(plt, "show", lambda *_a, **_k: None)
@@ -46,7 +42,7 @@ def test_main_function(monkeypatch) -> None:
     class DummyFile:
         name = "dummy.png"
 
-    for method in ["nn", "bl", "pw", "l2"]:
+    for method in ["nn", "bl", "pw", "bc", "lz", "mn", "l2"]:
         assert main_mod.main.callback(DummyFile(), method, 2, save=False, verbose=False) is None
     # Test invalid method
     ret = main_mod.main.callback(DummyFile(), "invalid", 2, save=False, verbose=False)
@@ -77,20 +73,14 @@ def test_main_invalid_file(monkeypatch) -> None:
         lambda *_a, **_k: (_ for _ in ()).throw(ValueError("bad file")),
     )
     monkeypatch.setattr(main_mod, "save_image", lambda *_a, **_k: None)
-    monkeypatch.setattr(
-        main_mod, "nearest_neighbor", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
-    monkeypatch.setattr(
-        main_mod, "bilinear_interpolation", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
-    monkeypatch.setattr(
-        main_mod,
-        "piecewise_linear_interpolation",
+    monkeypatch.setitem(main_mod.METHODS, "nn", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
+    monkeypatch.setitem(main_mod.METHODS, "bl", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
+    monkeypatch.setitem(
+        main_mod.METHODS,
+        "pw",
         lambda *_a, **_k: __import__("numpy").zeros((8, 8)),
     )
-    monkeypatch.setattr(
-        main_mod, "l2_optimal_interpolation", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
+    monkeypatch.setitem(main_mod.METHODS, "l2", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
     import matplotlib.pyplot as plt
 
     monkeypatch.setattr(plt, "show", lambda *_a, **_k: None)
@@ -108,20 +98,14 @@ def test_main_save_and_verbose(monkeypatch, tmp_path) -> None:
     called = {}
     monkeypatch.setattr(main_mod, "load_image", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
     monkeypatch.setattr(main_mod, "save_image", lambda *_a, **_k: called.setdefault("saved", True))
-    monkeypatch.setattr(
-        main_mod, "nearest_neighbor", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
-    monkeypatch.setattr(
-        main_mod, "bilinear_interpolation", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
-    monkeypatch.setattr(
-        main_mod,
-        "piecewise_linear_interpolation",
+    monkeypatch.setitem(main_mod.METHODS, "nn", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
+    monkeypatch.setitem(main_mod.METHODS, "bl", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
+    monkeypatch.setitem(
+        main_mod.METHODS,
+        "pw",
         lambda *_a, **_k: __import__("numpy").zeros((8, 8)),
     )
-    monkeypatch.setattr(
-        main_mod, "l2_optimal_interpolation", lambda *_a, **_k: __import__("numpy").zeros((8, 8))
-    )
+    monkeypatch.setitem(main_mod.METHODS, "l2", lambda *_a, **_k: __import__("numpy").zeros((8, 8)))
     import matplotlib.pyplot as plt
 
     monkeypatch.setattr(plt, "show", lambda *_a, **_k: None)
@@ -132,3 +116,63 @@ def test_main_save_and_verbose(monkeypatch, tmp_path) -> None:
     # Should call save_image and print verbose output
     main_mod.main.callback(DummyFile(), "nn", 2, save=True, verbose=True)
     assert called.get("saved")
+
+
+def test_main_jobs_uses_parallel(monkeypatch) -> None:
+    import matplotlib.pyplot as plt
+    import numpy as np
+
+    import image_resampler.__main__ as main_mod
+
+    calls = {}
+
+    def fake_parallel(image, method, _scale, workers) -> np.ndarray:
+        calls["args"] = (method, workers)
+        return image
+
+    monkeypatch.setattr(main_mod, "load_image", lambda *_a, **_k: np.zeros((8, 8)))
+    monkeypatch.setattr(main_mod, "upscale_parallel", fake_parallel)
+    monkeypatch.setattr(plt, "show", lambda *_a, **_k: None)
+
+    class DummyFile:
+        name = "dummy.png"
+
+    main_mod.main.callback(DummyFile(), "bl", 2, save=False, verbose=False, jobs=4)
+    assert calls["args"] == ("bl", 4)
+
+
+def test_main_fractional_scale_and_size(tmp_path) -> None:
+    import numpy as np
+    from click.testing import CliRunner
+    from PIL import Image
+
+    import image_resampler.__main__ as main_mod
+
+    path = tmp_path / "in.png"
+    Image.fromarray(np.zeros((10, 20), dtype=np.uint8)).save(path)
+    runner = CliRunner()
+    for args in [["-s", "1.5"], ["-s", "2x3"], ["--size", "30x15"]]:
+        result = runner.invoke(main_mod.main, [str(path), "-m", "bl", "--no-show", *args])
+        assert result.exit_code == 0, result.output
+    result = runner.invoke(main_mod.main, [str(path), "--no-show", "-s", "2x"])
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_main_l2_saves_input_dtype(tmp_path, monkeypatch, jobs) -> None:
+    import numpy as np
+    from click.testing import CliRunner
+    from PIL import Image
+
+    import image_resampler.__main__ as main_mod
+
+    path = tmp_path / "img.png"
+    Image.fromarray(np.arange(200, dtype=np.uint8).reshape(10, 20)).save(path)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "examples" / "output").mkdir(parents=True)
+    args = [str(path), "-m", "l2", "-s", "1.5", "--no-show", "--save", "-j", jobs]
+    result = CliRunner().invoke(main_mod.main, args)
+    assert result.exit_code == 0, result.output
+    out = np.array(Image.open(tmp_path / "examples" / "output" / "img_interp.png"))
+    assert out.shape == (15, 30)
+    assert out.dtype == np.uint8
@@ -1,11 +1,26 @@
+import tracemalloc
+
 import numpy as np
+import pytest
+from PIL import Image
 
+from image_resampler import methods
 from image_resampler.methods import (
+    bicubic_interpolation,
     bilinear_interpolation,
+    convert_dtype,
+    downscale,
     l2_optimal_interpolation,
+    lanczos_interpolation,
+    mitchell_interpolation,
     nearest_neighbor,
+    nearest_neighbor_view,
     piecewise_linear_interpolation,
+    resize,
 )
+from image_resampler.parallel import upscale_parallel
+from image_resampler.stream import upscale_stream
+from image_resampler.tiling import upscale_tiled
 
 
 def test_nearest_neighbor_identity() -> None:
@@ -38,24 +53,19 @@ def test_upscale_shapes() -> None:
         lambda a, s: nearest_neighbor(a, clip=False, scale=s),
         bilinear_interpolation,
         piecewise_linear_interpolation,
+        bicubic_interpolation,
+        lanczos_interpolation,
+        mitchell_interpolation,
         l2_optimal_interpolation,
     ]:
         out = func(arr, 2)
         assert out.shape == (6, 6)
 
 
-def test_methods_invalid_inputs() -> None:
-    arr = None
-    import contextlib
-
-    for func in [
-        nearest_neighbor,
-        bilinear_interpolation,
-        piecewise_linear_interpolation,
-        l2_optimal_interpolation,
-    ]:
-        with contextlib.suppress(Exception):
-            func(arr, 2)
+@pytest.mark.parametrize("method", list(methods.METHODS))
+def test_methods_invalid_inputs(method) -> None:
+    with pytest.raises(AttributeError):
+        methods.METHODS[method](None, 2)
 
 
 def test_nearest_neighbor_clip_branch() -> None:
@@ -64,31 +74,32 @@ def test_nearest_neighbor_clip_branch() -> None:
     assert out.shape == (6, 6)
 
 
-def test_methods_invalid_scale() -> None:
+@pytest.mark.parametrize("method", list(methods.METHODS))
+@pytest.mark.parametrize("scale", [0, -2, (2, 0), (2, -1)])
+def test_methods_invalid_scale(method, scale) -> None:
     arr = np.arange(9).reshape(3, 3)
-    import contextlib
-
-    with contextlib.suppress(Exception):
-        nearest_neighbor(arr, 0)
-    with contextlib.suppress(Exception):
-        bilinear_interpolation(arr, 0)
-    with contextlib.suppress(Exception):
-        piecewise_linear_interpolation(arr, 0)
-    with contextlib.suppress(Exception):
-        l2_optimal_interpolation(arr, 0)
-
-
-def test_methods_invalid_input() -> None:
-    import contextlib
-
-    with contextlib.suppress(Exception):
-        nearest_neighbor(None, 2)
-    with contextlib.suppress(Exception):
-        bilinear_interpolation(None, 2)
-    with contextlib.suppress(Exception):
-        piecewise_linear_interpolation(None, 2)
-    with contextlib.suppress(Exception):
-        l2_optimal_interpolation(None, 2)
+    calls = [
+        lambda: methods.METHODS[method](arr, scale),
+        lambda: upscale_parallel(arr, method, scale, workers=2),
+        lambda: next(upscale_stream([arr], method, scale)),
+    ]
+    if method != "l2":
+        calls.append(lambda: upscale_tiled(arr, method, scale))
+    for call in calls:
+        with pytest.raises(ValueError, match="positive"):
+            call()
+
+
+def test_single_image_entry_points_reject_stacks() -> None:
+    stack = np.zeros((2, 4, 4, 3))
+    for call in [
+        lambda: upscale_tiled(stack, "bl", 2),
+        lambda: upscale_parallel(stack, "bl", 2, workers=2),
+        lambda: upscale_parallel(stack, "l2", 2, workers=2),
+        lambda: next(upscale_stream([stack], "bl", 2)),
+    ]:
+        with pytest.raises(ValueError, match="single"):
+            call()
 
 
 def test_nearest_neighbor_dtype() -> None:
@@ -184,7 +195,350 @@ def test_methods_minimal_input() -> None:
         nearest_neighbor,
         bilinear_interpolation,
         piecewise_linear_interpolation,
+        bicubic_interpolation,
+        lanczos_interpolation,
+        mitchell_interpolation,
         l2_optimal_interpolation,
     ]:
         out = func(arr, 1)
         assert out.shape == (1, 1)
+
+
+def _reference_bilinear(image: np.ndarray, scale: float) -> np.ndarray:
+    out_h, out_w = int(np.round(image.shape[0] * scale)), int(np.round(image.shape[1] * scale))
+    out = np.empty((out_h, out_w, *image.shape[2:]))
+    for i in range(out_h):
+        x = i / scale
+        x0 = int(np.floor(x))
+        x1 = min(x0 + 1, image.shape[0] - 1)
+        for j in range(out_w):
+            y = j / scale
+            y0 = int(np.floor(y))
+            y1 = min(y0 + 1, image.shape[1] - 1)
+            top = (1 - (y - y0)) * image[x0, y0] + (y - y0) * image[x0, y1]
+            bottom = (1 - (y - y0)) * image[x1, y0] + (y - y0) * image[x1, y1]
+            out[i, j] = (1 - (x - x0)) * top + (x - x0) * bottom
+    return out
+
+
+def test_bilinear_matches_reference() -> None:
+    rng = np.random.default_rng(0)
+    arr = rng.random((5, 7, 3))
+    for scale in [2, 3, 1.5]:
+        out = bilinear_interpolation(arr, scale)
+        assert np.allclose(out, _reference_bilinear(arr, scale))
+
+
+def test_bilinear_integer_rounding() -> None:
+    rng = np.random.default_rng(1)
+    arr = rng.integers(0, 256, (6, 4, 3), dtype=np.uint8)
+    out = bilinear_interpolation(arr, 3)
+    assert out.dtype == np.uint8
+    assert np.abs(out - _reference_bilinear(arr, 3)).max() <= 0.5
+
+
+def test_nearest_neighbor_positional_scale() -> None:
+    arr = np.arange(6).reshape(2, 3)
+    out = nearest_neighbor(arr, 2)
+    assert out.shape == (4, 6)
+    assert set(np.unique(out)) <= set(np.unique(arr))
+
+
+def test_piecewise_linear_matches_bilinear() -> None:
+    rng = np.random.default_rng(2)
+    arr = rng.random((6, 5, 3))
+    for scale in [2, 2.5, (3, 1.5)]:
+        assert np.allclose(
+            piecewise_linear_interpolation(arr, scale), bilinear_interpolation(arr, scale)
+        )
+
+
+def test_plan_cache_hits_and_misses() -> None:
+    methods.plan_cache.clear()
+    arr = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    first = bilinear_interpolation(arr, 2)
+    assert methods.plan_cache.info()["misses"] == 1
+    second = bilinear_interpolation(arr, 2)
+    assert methods.plan_cache.info()["hits"] == 1
+    assert np.array_equal(first, second)
+    # Bilinear and piecewise linear share the same linear plan.
+    piecewise_linear_interpolation(arr, 2)
+    assert methods.plan_cache.info()["hits"] == 2
+    # Integer-scale nearest neighbor needs no plan; fractional scales do.
+    nearest_neighbor(arr, 2)
+    assert methods.plan_cache.info()["misses"] == 1
+    nearest_neighbor(arr, 1.5)
+    assert methods.plan_cache.info()["misses"] == 2
+
+
+def test_plan_cache_eviction() -> None:
+    cache = methods.PlanCache(maxsize=2, policy="lru")
+    for key in "abc":
+        cache.get(key, lambda key=key: (key,))
+    assert len(cache) == 2
+    cache.get("b", lambda: ("new",))
+    cache.get("d", lambda: ("d",))
+    assert cache.get("b", lambda: ("rebuilt",)) == ("b",)
+    fifo = methods.PlanCache(maxsize=2, policy="fifo")
+    fifo.get("a", lambda: ("a",))
+    fifo.get("b", lambda: ("b",))
+    fifo.get("a", lambda: ("a2",))
+    fifo.get("c", lambda: ("c",))
+    assert fifo.get("a", lambda: ("a3",)) == ("a3",)
+    with pytest.raises(ValueError, match="eviction policy"):
+        methods.PlanCache(policy="random")
+
+
+def test_plan_cache_disabled() -> None:
+    cache = methods.PlanCache(maxsize=0)
+    cache.get("a", lambda: ("a",))
+    assert len(cache) == 0
+    assert cache.info()["misses"] == 1
+
+
+def _reference_l2(channel: np.ndarray, scale: float) -> np.ndarray:
+    h, w = channel.shape
+    new_h, new_w = round(h * scale), round(w * scale)
+    f = np.fft.fftshift(np.fft.fft2(channel))
+    f_up = np.zeros((new_h, new_w), dtype=complex)
+    top, left = new_h // 2 - h // 2, new_w // 2 - w // 2
+    f_up[top : top + h, left : left + w] = f
+    return np.real(np.fft.ifft2(np.fft.ifftshift(f_up))) * (new_h * new_w) / (h * w)
+
+
+def test_l2_optimal_matches_full_spectrum_padding() -> None:
+    rng = np.random.default_rng(3)
+    for shape in [(4, 4, 3), (5, 6, 2), (7, 3, 1), (6, 8, 3)]:
+        arr = rng.random(shape)
+        for scale in [2, 3, 1.5, 2.5]:
+            out = l2_optimal_interpolation(arr, scale)
+            for c in range(shape[2]):
+                assert np.allclose(out[..., c], _reference_l2(arr[..., c], scale))
+
+
+def test_l2_optimal_single_precision() -> None:
+    rng = np.random.default_rng(4)
+    arr = rng.integers(0, 256, (6, 5, 3), dtype=np.uint8)
+    out = l2_optimal_interpolation(arr, 2, fft_dtype=np.float32)
+    assert out.dtype == np.float32
+    assert np.allclose(out, l2_optimal_interpolation(arr, 2), atol=1e-3)
+    # Zero-padding interpolates: the original samples are reproduced exactly.
+    assert np.allclose(out[::2, ::2], arr, atol=1e-3)
+
+
+def test_piecewise_linear_fused() -> None:
+    rng = np.random.default_rng(5)
+    arr = rng.integers(0, 256, (9, 7, 3), dtype=np.uint8)
+    fused = piecewise_linear_interpolation(arr, 3, fused=True)
+    assert fused.dtype == arr.dtype
+    assert np.array_equal(fused, bilinear_interpolation(arr, 3))
+    unfused = piecewise_linear_interpolation(arr, 3)
+    assert np.abs(fused.astype(int) - unfused).max() <= 1
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        nearest_neighbor,
+        bilinear_interpolation,
+        piecewise_linear_interpolation,
+        bicubic_interpolation,
+        lanczos_interpolation,
+        mitchell_interpolation,
+        l2_optimal_interpolation,
+    ],
+)
+def test_methods_batched_stack(func) -> None:
+    rng = np.random.default_rng(6)
+    stack = rng.integers(0, 256, (2, 3, 7, 5, 3), dtype=np.uint8)
+    expected = np.stack([[func(image, 2) for image in group] for group in stack])
+    for chunk_size in [None, 1, 2]:
+        out = func(stack, 2, chunk_size=chunk_size)
+        assert out.shape == (2, 3, 14, 10, 3)
+        assert out.flags.c_contiguous
+        assert np.allclose(out, expected)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        nearest_neighbor,
+        bilinear_interpolation,
+        piecewise_linear_interpolation,
+        bicubic_interpolation,
+        lanczos_interpolation,
+        mitchell_interpolation,
+        l2_optimal_interpolation,
+    ],
+)
+def test_methods_write_into_out(func) -> None:
+    rng = np.random.default_rng(7)
+    arr = rng.random((5, 4, 3)) * 300 - 20
+    out = np.empty((10, 8, 3), dtype=np.uint8)
+    assert func(arr, 2, out=out) is out
+    expected = np.clip(np.rint(func(arr, 2)), 0, 255)
+    assert np.array_equal(out, expected)
+    assert np.array_equal(func(arr, 2, output_dtype=np.uint8), out)
+    with pytest.raises(ValueError, match="shape"):
+        func(arr, 2, out=np.empty((10, 8), dtype=np.uint8))
+    with pytest.raises(ValueError, match="output_dtype"):
+        func(arr, 2, out=out, output_dtype=np.float32)
+
+
+def test_l2_optimal_default_dtype() -> None:
+    arr = np.arange(16, dtype=np.uint8).reshape(4, 4)
+    assert l2_optimal_interpolation(arr, 2).dtype == np.float64
+    out = l2_optimal_interpolation(arr, 2, output_dtype=np.uint8)
+    assert out.dtype == np.uint8
+    assert np.array_equal(out[::2, ::2], arr)
+
+
+@pytest.mark.parametrize("func", [nearest_neighbor, bilinear_interpolation])
+def test_methods_out_avoids_allocations(func, monkeypatch) -> None:
+    monkeypatch.setattr(methods, "_BLOCK_BYTES", 1 << 14)
+    arr = np.random.default_rng(8).integers(0, 256, (128, 128, 3), dtype=np.uint8)
+    out = np.empty((512, 512, 3), dtype=np.uint8)
+    func(arr, 4, out=out)
+    tracemalloc.start()
+    func(arr, 4, out=out)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < out.nbytes // 8
+
+
+def test_nearest_neighbor_integer_fast_path() -> None:
+    rng = np.random.default_rng(9)
+    arr = rng.integers(0, 256, (2, 5, 4, 3), dtype=np.uint8)
+    for scale, h, w in [(1, 1, 1), (2, 2, 2), ((3, 2), 3, 2)]:
+        expected = arr.repeat(h, axis=1).repeat(w, axis=2)
+        assert np.array_equal(nearest_neighbor(arr, scale), expected)
+        # The general index-table path agrees with the block replication.
+        assert np.array_equal(
+            nearest_neighbor(arr, scale, output_dtype=np.int8),
+            expected.astype(np.int16).clip(-128, 127),
+        )
+        view = nearest_neighbor_view(arr[0], scale)
+        assert not view.flags.writeable
+        assert np.shares_memory(view, arr)
+        assert np.array_equal(view.reshape(expected.shape[1:]), expected[0])
+    with pytest.raises(ValueError, match="integer"):
+        nearest_neighbor_view(arr, 1.5)
+
+
+def test_l2_optimal_arbitrary_scale() -> None:
+    signal = pytest.importorskip("scipy.signal")
+    rng = np.random.default_rng(10)
+    # Even x even images growing on both axes keep the centered-padding Nyquist corner
+    # (see test_l2_optimal_matches_full_spectrum_padding), which is not separable.
+    for shape in [(6, 9, 3), (7, 5, 1), (8, 9, 2), (5, 8, 1)]:
+        arr = rng.random(shape)
+        for scale in [1.5, 2.5, 0.5, (1.25, 3), (2, 0.75), 13 / 7]:
+            out = l2_optimal_interpolation(arr, scale)
+            h_scale, w_scale = scale if isinstance(scale, tuple) else (scale, scale)
+            new_h, new_w = round(shape[0] * h_scale), round(shape[1] * w_scale)
+            expected = signal.resample(signal.resample(arr, new_h, axis=0), new_w, axis=1)
+            assert out.shape == expected.shape
+            assert np.allclose(out, expected)
+    with pytest.raises(ValueError, match="positive"):
+        l2_optimal_interpolation(arr, 0)
+
+
+@pytest.mark.parametrize(
+    ("func", "resample"),
+    [
+        (bicubic_interpolation, Image.Resampling.BICUBIC),
+        (lanczos_interpolation, Image.Resampling.LANCZOS),
+    ],
+)
+@pytest.mark.parametrize("scale", [1.5, 2, 3])
+def test_cubic_and_lanczos_match_pillow(func, resample, scale) -> None:
+    # Sizes that scale exactly, as Pillow derives the kernel positions from the output size.
+    image = np.random.default_rng(9).random((12, 18)).astype(np.float32)
+    out = func(image, scale)
+    expected = np.asarray(Image.fromarray(image, "F").resize(out.shape[::-1], resample))
+    assert np.allclose(out, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize(
+    "func", [bicubic_interpolation, lanczos_interpolation, mitchell_interpolation]
+)
+def test_filter_methods_keep_constants(func) -> None:
+    assert np.allclose(func(np.full((9, 11), 7.0), 2.5), 7.0)
+
+
+@pytest.mark.parametrize("func", [bicubic_interpolation, mitchell_interpolation])
+def test_cubic_methods_reproduce_ramps(func) -> None:
+    ramp = np.add.outer(np.arange(9.0), np.arange(11.0))
+    out = func(ramp, 2)
+    # Away from the edges, where rows are renormalized, a linear ramp is exact.
+    inner = out[6:-6, 6:-6]
+    expected = np.add.outer(np.arange(18.0) / 2 - 0.25, np.arange(22.0) / 2 - 0.25)[6:-6, 6:-6]
+    assert np.allclose(inner, expected)
+
+
+def test_mitchell_smooths_more_than_bicubic() -> None:
+    step = np.repeat([[0.0] * 8 + [1.0] * 8], 4, axis=0)
+    assert np.ptp(mitchell_interpolation(step, 4)) < np.ptp(bicubic_interpolation(step, 4))
+    assert np.array_equal(bicubic_interpolation(step, 1), step)
+
+
+@pytest.mark.parametrize("kernel", ["area", "box"])
+def test_downscale_integer_factor_is_block_mean(kernel) -> None:
+    rng = np.random.default_rng(0)
+    stack = rng.integers(0, 256, size=(2, 12, 18, 3), dtype=np.uint8)
+    expected = stack.reshape(2, 4, 3, 6, 3, 3).mean(axis=(2, 4))
+    out = downscale(stack, 1 / 3, kernel=kernel)
+    assert out.dtype == np.uint8
+    assert np.array_equal(out, np.rint(expected))
+
+
+@pytest.mark.parametrize("kernel", methods.DOWNSCALE_KERNELS)
+def test_downscale_fractional_factor(kernel) -> None:
+    rng = np.random.default_rng(1)
+    image = rng.random((20, 30))
+    out = downscale(image, (0.45, 0.3), kernel=kernel)
+    assert out.shape == (9, 9)
+    assert image.min() <= out.min()
+    assert out.max() <= image.max()
+    assert np.allclose(downscale(np.full((20, 30), 5.0), 0.45, kernel=kernel), 5.0)
+
+
+def test_downscale_area_preserves_mean() -> None:
+    image = np.random.default_rng(2).random((15, 10))
+    # 15 -> 6 and 10 -> 4 rows: every output pixel covers the same input area.
+    assert np.isclose(downscale(image, 0.4).mean(), image.mean())
+
+
+def test_downscale_antialiases() -> None:
+    # A one-pixel checkerboard averages out instead of aliasing to a solid color.
+    checker = (np.indices((32, 32)).sum(axis=0) % 2).astype(np.float64)
+    for kernel in methods.DOWNSCALE_KERNELS:
+        assert np.allclose(downscale(checker, 0.25, kernel=kernel), 0.5, atol=0.01)
+    assert np.all(nearest_neighbor(checker, 0.25) == checker[2, 2])
+
+
+def test_downscale_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError, match="Unknown kernel"):
+        downscale(np.ones((4, 4)), 0.5, kernel="gaussian")
+    with pytest.raises(ValueError, match="positive"):
+        downscale(np.ones((4, 4)), 0)
+
+
+def test_resize_to_shape() -> None:
+    image = np.random.default_rng(3).integers(0, 256, size=(21, 34, 3), dtype=np.uint8)
+    assert resize(image, (10, 13, 3)).shape == (10, 13, 3)
+    assert resize(image, (40, 50), output_dtype=np.float32).dtype == np.float32
+    assert resize(image[None], (7, 9)).shape == (1, 7, 9, 3)
+
+
+def test_convert_dtype() -> None:
+    values = np.array([-3.0, 1.4, 1.6, 300.0])
+    out = convert_dtype(values, np.uint8)
+    assert out.dtype == np.uint8
+    assert out.tolist() == [0, 1, 2, 255]
+    # The input is left alone unless the caller allows overwriting it.
+    assert values.tolist() == [-3.0, 1.4, 1.6, 300.0]
+    assert convert_dtype(values, np.uint8, overwrite=True).tolist() == [0, 1, 2, 255]
+    assert values.tolist() == [0.0, 1.0, 2.0, 255.0]
+    assert convert_dtype(out, np.uint8) is out
+    assert convert_dtype(out, np.float32).tolist() == [0, 1, 2, 255]
@@ -69,3 +69,97 @@ def test_metrics_dtype_branch() -> None:
     metrics.compute_psnr(arr, arr2)
     metrics.compute_ssim(arr, arr2)
     metrics.compute_mse(arr, arr2)
+
+
+@pytest.mark.parametrize("chunk", [7, 1 << 18])
+def test_compute_metrics_single_pass(chunk, monkeypatch) -> None:
+    monkeypatch.setattr(metrics, "_CHUNK_ELEMENTS", chunk)
+    rng = np.random.default_rng(0)
+    arr1 = rng.integers(0, 256, (20, 15, 3), dtype=np.uint8)
+    arr2 = rng.integers(0, 256, (20, 15, 3), dtype=np.uint8)
+    mse = np.mean((arr1.astype(np.float64) - arr2) ** 2)
+    data_range = float(arr1.max()) - arr1.min()
+    for a, b in [(arr1, arr2), (arr1.transpose(1, 0, 2), arr2.transpose(1, 0, 2))]:
+        result = metrics.compute_metrics(a, b)
+        assert result["data_range"] == data_range
+        assert np.isclose(result["mse"], mse)
+        assert np.isclose(result["psnr"], 10 * np.log10(data_range**2 / mse))
+    single = metrics.compute_metrics(arr1, arr2, accumulator=np.float32)
+    assert np.isclose(single["mse"], mse, rtol=1e-5)
+    assert metrics.compute_psnr(arr1, arr2) == metrics.compute_metrics(arr1, arr2)["psnr"]
+    assert metrics.compute_mse(arr1, arr2) == metrics.compute_metrics(arr1, arr2)["mse"]
+
+
+def test_compute_metrics_special_cases() -> None:
+    arr = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    assert metrics.compute_metrics(arr, arr)["psnr"] == float("inf")
+    flat = np.zeros((3, 4))
+    assert np.isnan(metrics.compute_metrics(flat, flat + 1)["psnr"])
+    assert metrics.compute_metrics(flat, flat)["psnr"] == float("inf")
+
+
+@pytest.mark.parametrize(("shape", "win_size"), [((40, 30, 3), 7), ((25, 33), 5), ((9, 12, 2), 3)])
+def test_ssim_matches_skimage(shape, win_size) -> None:
+    from skimage.metrics import structural_similarity
+
+    rng = np.random.default_rng(1)
+    arr1 = rng.integers(0, 256, shape, dtype=np.uint8)
+    arr2 = np.clip(arr1 + rng.normal(0, 20, shape), 0, 255).astype(np.uint8)
+    expected = structural_similarity(
+        arr1,
+        arr2,
+        data_range=255,
+        channel_axis=-1 if len(shape) == 3 else None,
+        win_size=win_size,
+    )
+    assert np.isclose(metrics.ssim(arr1, arr2, 255, win_size), expected, rtol=0, atol=1e-5)
+    # Tiles of a few output rows read the window overlap and give the same result.
+    tiled = metrics.ssim(arr1, arr2, 255, win_size, tile_rows=2)
+    assert np.isclose(tiled, expected, rtol=0, atol=1e-5)
+
+
+def test_compute_ssim_small_and_float_images() -> None:
+    from skimage.metrics import structural_similarity
+
+    rng = np.random.default_rng(2)
+    arr1 = rng.random((6, 9))
+    arr2 = arr1 + rng.normal(0, 0.05, arr1.shape)
+    data_range = arr1.max() - arr1.min()
+    expected = structural_similarity(arr1, arr2, data_range=data_range, win_size=5)
+    assert np.isclose(metrics.compute_ssim(arr1, arr2), expected, rtol=0, atol=1e-5)
+    with pytest.raises(ValueError, match="win_size"):
+        metrics.ssim(arr1, arr2, 1.0, 8)
+
+
+def test_ssim_memory_is_bounded_by_tiles(monkeypatch) -> None:
+    import tracemalloc
+
+    monkeypatch.setattr(metrics, "_SSIM_TILE_BYTES", 1 << 16)
+    rng = np.random.default_rng(3)
+    arr1 = rng.integers(0, 256, (256, 256, 3), dtype=np.uint8)
+    arr2 = rng.integers(0, 256, (256, 256, 3), dtype=np.uint8)
+    tracemalloc.start()
+    metrics.ssim(arr1, arr2, 255)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < arr1.nbytes
+
+
+def test_ssim_with_large_dc_offset() -> None:
+    from skimage.metrics import structural_similarity
+
+    rng = np.random.default_rng(4)
+    yy, xx = np.mgrid[:48, :64]
+    smooth = 30000 + 100 * np.sin(xx / 9) * np.cos(yy / 7)
+    arr1 = smooth.astype(np.uint16)
+    arr2 = np.clip(arr1 + rng.normal(0, 2, arr1.shape), 0, 65535).astype(np.uint16)
+    data_range = float(arr1.max()) - arr1.min()
+    expected = structural_similarity(arr1, arr2, data_range=data_range)
+    assert np.isclose(metrics.compute_ssim(arr1, arr2), expected, rtol=0, atol=1e-5)
+    # A tiny signal on a large level: float32 second moments would cancel to garbage.
+    signal = np.sin(xx / 5) + rng.normal(0, 0.3, xx.shape)
+    img1 = 1000 + 1e-3 * signal
+    img2 = 1000 + 1e-3 * (signal + rng.normal(0, 0.5, signal.shape))
+    expected = structural_similarity(img1, img2, data_range=np.ptp(img1))
+    # scikit-image's own float64 moments lose about 1e-4 here.
+    assert np.isclose(metrics.compute_ssim(img1, img2), expected, rtol=0, atol=1e-3)
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from image_resampler.methods import METHODS
+from image_resampler.parallel import upscale_parallel
+
+
+@pytest.mark.parametrize("method", ["nn", "bl", "pw", "l2"])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_matches_serial(method, workers) -> None:
+    rng = np.random.default_rng(0)
+    for arr in [
+        rng.integers(0, 256, (40, 21, 3), dtype=np.uint8),
+        rng.random((37, 18)),
+    ]:
+        expected = METHODS[method](arr, 2)
+        out = upscale_parallel(arr, method, 2, workers=workers)
+        assert out.dtype == expected.dtype
+        assert np.array_equal(out, expected)
+
+
+@pytest.mark.parametrize("method", ["bl", "l2"])
+def test_parallel_process_backend(method) -> None:
+    rng = np.random.default_rng(1)
+    arr = rng.integers(0, 256, (40, 24, 3), dtype=np.uint8)
+    out = upscale_parallel(arr, method, 2, workers=2, backend="process")
+    assert np.array_equal(out, METHODS[method](arr, 2))
+
+
+def test_parallel_invalid_arguments() -> None:
+    arr = np.zeros((4, 4), dtype=np.uint8)
+    with pytest.raises(ValueError, match="Unknown method"):
+        upscale_parallel(arr, "xx", 2, workers=2)
+    with pytest.raises(ValueError, match="Unknown backend"):
+        upscale_parallel(arr, "nn", 2, backend="gpu")
+    with pytest.raises(ValueError, match="positive"):
+        upscale_parallel(arr, "l2", -1, workers=2)
@@ -0,0 +1,46 @@
+import click
+import pytest
+
+from image_resampler.params import (
+    SCALE,
+    SIZE,
+    format_scale,
+    parse_scale,
+    parse_size,
+    scale_for_size,
+)
+
+
+def test_parse_scale() -> None:
+    assert parse_scale("2") == 2
+    assert parse_scale("1.5") == 1.5
+    # WxH: the width factor comes first, the pair is (h_scale, w_scale).
+    assert parse_scale("2x3") == (3, 2)
+    assert parse_scale("2X2") == 2
+    for bad in ["0", "-1", "2x", "1x2x3", "abc"]:
+        with pytest.raises(ValueError, match=r"scale|could not convert"):
+            parse_scale(bad)
+
+
+def test_parse_size_and_scale_for_size() -> None:
+    assert parse_size("1920x1080") == (1920, 1080)
+    for bad in ["1920", "0x10", "axb"]:
+        with pytest.raises(ValueError, match="invalid size"):
+            parse_size(bad)
+    assert scale_for_size((540, 960, 3), (1920, 1080)) == 2
+    assert scale_for_size((100, 100), (150, 300)) == (3, 1.5)
+
+
+def test_format_scale() -> None:
+    assert format_scale(2.0) == "2"
+    assert format_scale(1.5) == "1.5"
+    assert format_scale((3.0, 2.0)) == "2x3"
+
+
+def test_param_types() -> None:
+    assert SCALE.convert("1.5x2", None, None) == (2, 1.5)
+    assert SIZE.convert("4x3", None, None) == (4, 3)
+    with pytest.raises(click.BadParameter):
+        SCALE.convert("x", None, None)
+    with pytest.raises(click.BadParameter):
+        SIZE.convert("4", None, None)
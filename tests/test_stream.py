@@ -0,0 +1,125 @@
+import io
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+from PIL import Image
+
+from image_resampler.methods import (
+    METHODS,
+    bilinear_interpolation,
+    l2_optimal_interpolation,
+    nearest_neighbor,
+)
+from image_resampler.stream import read_raw_frames, stream, upscale_stream
+
+
+def _frames(count, shape=(6, 5, 3)) -> list:
+    rng = np.random.default_rng(0)
+    return [rng.integers(0, 256, shape, dtype=np.uint8) for _ in range(count)]
+
+
+@pytest.mark.parametrize("method", ["nn", "bl", "pw"])
+def test_stream_matches_methods(method) -> None:
+    frames = _frames(4)
+    results = [out.copy() for out in upscale_stream(frames, method, 3)]
+    assert len(results) == 4
+    for frame, out in zip(frames, results, strict=True):
+        assert np.array_equal(out, METHODS[method](frame, 3))
+
+
+def test_stream_reuses_out_buffer() -> None:
+    frames = _frames(3)
+    out = np.empty((12, 10, 3), dtype=np.float32)
+    for frame, result in zip(frames, upscale_stream(frames, "bl", 2, out=out), strict=True):
+        assert result is out
+        assert np.allclose(out, bilinear_interpolation(frame.astype(np.float32), 2))
+    l2 = list(upscale_stream(frames[:1], "l2", 2, out=out))
+    assert l2[0] is out
+    assert np.allclose(out, l2_optimal_interpolation(frames[0], 2))
+
+
+def test_stream_rejects_mismatched_frames() -> None:
+    frames = [*_frames(1), *_frames(1, (7, 5, 3))]
+    with pytest.raises(ValueError, match="All frames"):
+        list(upscale_stream(frames, "nn", 2))
+    with pytest.raises(ValueError, match="shape"):
+        list(upscale_stream(frames[:1], "nn", 2, out=np.empty((2, 2, 3))))
+    assert list(upscale_stream([], "nn", 2)) == []
+
+
+def test_read_raw_frames() -> None:
+    frames = _frames(3)
+    data = b"".join(frame.tobytes() for frame in frames)
+    read = [frame.copy() for frame in read_raw_frames(io.BytesIO(data), (6, 5, 3), np.uint8)]
+    assert all(np.array_equal(a, b) for a, b in zip(read, frames, strict=True))
+    with pytest.raises(ValueError, match="partway"):
+        list(read_raw_frames(io.BytesIO(data[:-1]), (6, 5, 3), np.uint8))
+
+
+def test_stream_command_directories(tmp_path) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    frames = _frames(3)
+    for i, frame in enumerate(frames):
+        Image.fromarray(frame).save(src / f"{i:03d}.png")
+    result = CliRunner().invoke(stream, [str(src), str(dst), "-m", "nn", "-s", "2"])
+    assert result.exit_code == 0, result.output
+    for i, frame in enumerate(frames):
+        assert np.array_equal(
+            np.array(Image.open(dst / f"{i:03d}.png")), nearest_neighbor(frame, 2)
+        )
+
+
+def test_stream_command_mismatched_frames(tmp_path) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    for i, frame in enumerate([*_frames(2), *_frames(1, (7, 5, 3))]):
+        Image.fromarray(frame).save(src / f"{i:03d}.png")
+    result = CliRunner().invoke(stream, [str(src), str(dst)])
+    assert result.exit_code == 1
+    assert "Error: All frames must have shape (6, 5, 3)" in result.output
+    result = CliRunner().invoke(stream, ["-", "-", "--shape", "6x5x3"], input=b"\0" * 100)
+    assert result.exit_code == 1
+    assert "partway" in result.output
+
+
+def test_stream_command_size(tmp_path) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    for i, frame in enumerate(_frames(2)):
+        Image.fromarray(frame).save(src / f"{i:03d}.png")
+    result = CliRunner().invoke(stream, [str(src), str(dst), "--size", "8x9"])
+    assert result.exit_code == 0, result.output
+    assert [Image.open(dst / f"{i:03d}.png").size for i in range(2)] == [(8, 9)] * 2
+    data = _frames(1)[0].tobytes()
+    result = CliRunner().invoke(stream, ["-", "-", "--shape", "6x5x3", "-s", "1.5"], input=data)
+    assert result.exit_code == 0, result.output
+    assert len(result.stdout_bytes) == 9 * 8 * 3
+
+
+def test_stream_command_16bit_pgm(tmp_path) -> None:
+    src, dst = tmp_path / "in", tmp_path / "out"
+    src.mkdir()
+    frames = [f.astype(np.uint16)[..., 0] * 257 for f in _frames(2)]
+    for i, frame in enumerate(frames):
+        Image.fromarray(frame).save(src / f"{i:03d}.pgm")
+    result = CliRunner().invoke(stream, [str(src), str(dst), "-m", "bl", "-s", "2"])
+    assert result.exit_code == 0, result.output
+    for i, frame in enumerate(frames):
+        out = np.array(Image.open(dst / f"{i:03d}.pgm"))
+        assert np.array_equal(out, bilinear_interpolation(frame, 2))
+
+
+def test_stream_command_pipe() -> None:
+    frames = _frames(2)
+    data = b"".join(frame.tobytes() for frame in frames)
+    runner = CliRunner()
+    result = runner.invoke(stream, ["-", "-", "--shape", "6x5x3", "-s", "2"], input=data)
+    assert result.exit_code == 0, result.output
+    out = np.frombuffer(result.stdout_bytes, dtype=np.uint8).reshape(2, 12, 10, 3)
+    for frame, upscaled in zip(frames, out, strict=True):
+        assert np.array_equal(upscaled, bilinear_interpolation(frame, 2))
+    result = runner.invoke(stream, ["-", "-"], input=data)
+    assert result.exit_code != 0
+    assert "--shape" in result.output
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from image_resampler.methods import (
+    METHODS,
+    bilinear_interpolation,
+    nearest_neighbor,
+    piecewise_linear_interpolation,
+)
+from image_resampler.tiling import iter_tiles, upscale_tiled
+
+
+@pytest.mark.parametrize("method", ["nn", "bl", "pw", "bc", "lz", "mn"])
+def test_tiled_matches_untiled(method) -> None:
+    rng = np.random.default_rng(0)
+    for arr in [
+        rng.integers(0, 256, (23, 17, 3), dtype=np.uint8),
+        rng.random((19, 26)).astype(np.float32),
+    ]:
+        for scale in [2, 3, 1.5, (2, 2.5)]:
+            expected = METHODS[method](arr, scale)
+            for tile_size in [1, 7, (5, 64), 512]:
+                out = upscale_tiled(arr, method, scale, tile_size=tile_size)
+                assert out.dtype == expected.dtype
+                assert np.array_equal(out, expected)
+
+
+def test_tiled_memmap_output(tmp_path) -> None:
+    rng = np.random.default_rng(1)
+    arr = rng.integers(0, 256, (20, 30, 3), dtype=np.uint8)
+    src = tmp_path / "in.npy"
+    np.save(src, arr)
+    mapped = np.load(src, mmap_mode="r")
+    out = upscale_tiled(mapped, "bl", 4, out=tmp_path / "out.npy", tile_size=16)
+    assert isinstance(out, np.memmap)
+    assert np.array_equal(np.load(tmp_path / "out.npy"), bilinear_interpolation(arr, 4))
+    raw = upscale_tiled(arr, "nn", 2, out=tmp_path / "out.raw", tile_size=8)
+    on_disk = np.fromfile(tmp_path / "out.raw", dtype=np.uint8).reshape(raw.shape)
+    assert np.array_equal(on_disk, nearest_neighbor(arr, 2))
+
+
+def test_tiled_rejects_bad_inputs() -> None:
+    arr = np.zeros((4, 4), dtype=np.uint8)
+    with pytest.raises(ValueError, match="Tiled upscaling supports"):
+        upscale_tiled(arr, "l2", 2)
+    with pytest.raises(ValueError, match="shape"):
+        upscale_tiled(arr, "nn", 2, out=np.empty((4, 4), dtype=np.uint8))
+
+
+def test_tiled_reports_progress() -> None:
+    arr = np.zeros((10, 10), dtype=np.uint8)
+    calls = []
+    upscale_tiled(arr, "bl", 2, tile_size=(8, 20), progress=lambda *a: calls.append(a))
+    assert calls == [(1, 3), (2, 3), (3, 3)]
+
+    def cancel(done: int, _total: int) -> None:
+        if done == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        upscale_tiled(arr, "bl", 2, tile_size=(8, 20), progress=cancel)
+
+
+def test_iter_tiles_covers_output() -> None:
+    covered = np.zeros((10, 7), dtype=int)
+    for rows, cols in iter_tiles((10, 7), (4, 3)):
+        covered[rows, cols] += 1
+    assert (covered == 1).all()
+
+
+def test_tiled_reads_mapped_image_path(tmp_path) -> None:
+    from PIL import Image
+
+    arr = np.random.default_rng(2).integers(0, 256, (12, 10, 3), dtype=np.uint8)
+    path = tmp_path / "in.ppm"
+    Image.fromarray(arr).save(path)
+    out = upscale_tiled(path, "pw", 2, tile_size=5)
+    assert np.array_equal(out, piecewise_linear_interpolation(arr, 2))